@@ -6,4 +6,4 @@ source "$SCRIPT_DIR"/activate.sh
 
 PARENT_DIR="$( dirname "$SCRIPT_DIR" )"
 
-"$PARENT_DIR"/src/aoc/run.py
+"$PARENT_DIR"/src/aoc/run.py "$@"
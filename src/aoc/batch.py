@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import os
+import pathlib
+import sys
+import time
+
+import aoc.utils.days
+
+
+def warm(day: int) -> None:
+    # once per worker, so an input only pays for solving
+    aoc.utils.days.setup_day(aoc.utils.days.day_module(day))
+
+
+def solve_file(day: int, path: pathlib.Path) -> dict:
+    result = {'input': path.name, 'day': day}
+    start = time.perf_counter()
+    try:
+        part1, part2 = aoc.utils.days.day_module(day).solve(path.read_text())
+        result['part1'] = part1
+        result['part2'] = part2
+    except Exception as e:
+        result['error'] = aoc.utils.days.describe_error(e)
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def input_files(directory: pathlib.Path, pattern: str) -> list[pathlib.Path]:
+    return sorted(p for p in directory.glob(pattern) if p.is_file())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Solve one day for every input in a directory, results as JSON lines')
+    parser.add_argument('day', type=int, help='day to solve')
+    parser.add_argument('directory', type=pathlib.Path, help='directory of inputs')
+    parser.add_argument('-p', '--pattern', default='*.txt', help='inputs to pick up from the directory (default: *.txt)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='number of worker processes (default: one per CPU)')
+    parser.add_argument('-o', '--output', type=pathlib.Path, help='write the JSON lines to this file rather than stdout')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    paths = input_files(args.directory, args.pattern)
+    out = args.output.open('w') if args.output else sys.stdout
+    failed = False
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs, initializer=warm, initargs=(args.day,)) as pool:
+            futures = [pool.submit(solve_file, args.day, path) for path in paths]
+            # written as each input finishes, not in directory order
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                failed = failed or 'error' in result
+                out.write(json.dumps(result) + '\n')
+                out.flush()
+    finally:
+        if args.output:
+            out.close()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
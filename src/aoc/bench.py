@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import pathlib
+import platform
+import sqlite3
+import statistics
+import sys
+import time
+
+import aoc.gen.run
+import aoc.utils.answers
+import aoc.utils.cache
+import aoc.utils.data
+import aoc.utils.days
+import aoc.utils.history
+import aoc.utils.memory
+import aoc.utils.paths
+
+
+def percentile(times: list[float], pct: float) -> float:
+    # nearest rank
+    ordered = sorted(times)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def summarise(day: int, part: int, times: list[float]) -> dict:
+    path = aoc.utils.paths.day_input_path(day)
+    return {
+        'day': day,
+        'part': part,
+        'input': path.name,
+        'input_hash': aoc.utils.answers.file_digest(path),
+        'bytes': path.stat().st_size,
+        'repeat': len(times),
+        'min': min(times),
+        'median': statistics.median(times),
+        'p95': percentile(times, 95),
+        'times': times,
+    }
+
+
+def time_part(day: int, part: int, repeat: int, warmup: int) -> list[float]:
+    func = aoc.utils.days.part_function(day, part)
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        # memoized results and the parsed input from the last run would make every run after the first
+        # look nearly free, each timed run parses the input again
+        aoc.utils.cache.clear()
+        aoc.utils.data.clear_cache()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def peak_memory(day: int, part: int) -> int:
+    # one more run under tracemalloc, kept out of the timings because tracing slows everything down
+    func = aoc.utils.days.part_function(day, part)
+    aoc.utils.cache.clear()
+    aoc.utils.data.clear_cache()
+    tracker = aoc.utils.memory.start()
+    try:
+        func()
+    finally:
+        memory = aoc.utils.memory.stop(tracker, top=0)
+    return memory['peak']
+
+
+def bench(days: list[int], parts: list[int], repeat: int, warmup: int, inputs: list[str], memory: bool = False) -> list[dict]:
+    results = []
+    for day in days:
+        for part in parts:
+            for filename in inputs:
+                aoc.utils.paths.set_input_filename(filename)
+                try:
+                    times = time_part(day, part, repeat, warmup)
+                    peak = peak_memory(day, part) if memory else None
+                except Exception as e:
+                    print(f'day{day:02}/part{part} {filename}: failed ({aoc.utils.days.describe_error(e)})', file=sys.stderr)
+                    continue
+                result = summarise(day, part, times)
+                result['peak'] = peak
+                print_result(result)
+                results.append(result)
+    return results
+
+
+def slope(points: list[tuple[float, float]]) -> float | None:
+    # least squares fit of log(time) against log(size), 1 is linear, 2 quadratic
+    logs = [(math.log(size), math.log(seconds)) for size, seconds in points if size > 0 and seconds > 0]
+    if len(logs) < 2:
+        return None
+    mean_x = statistics.mean(x for x, _ in logs)
+    mean_y = statistics.mean(y for _, y in logs)
+    sxx = sum((x - mean_x) ** 2 for x, _ in logs)
+    if not sxx:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / sxx
+
+
+def print_scaling(results: list[dict], width: int = 40) -> None:
+    by_part = {}
+    for r in results:
+        by_part.setdefault((r['day'], r['part']), []).append(r)
+    for (day, part), runs in by_part.items():
+        runs.sort(key=lambda r: r['bytes'])
+        fit = slope([(r['bytes'], r['median']) for r in runs])
+        exponent = f'{fit:.2f}' if fit is not None else '?'
+        # anything noticeably worse than linear is worth a look
+        flag = ' superlinear' if fit is not None and fit > 1.2 else ''
+        print(f'\nday{day:02}/part{part}: time ~ size^{exponent}{flag}')
+        longest = max(r['median'] for r in runs)
+        for r in runs:
+            bar = '#' * max(round(width * r['median'] / longest), 1) if longest else ''
+            print(f'  {r["input"]:>12} {aoc.utils.memory.format_bytes(r["bytes"]):>10} {format_seconds(r["median"]):>10} {bar}')
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.1f}us'
+    if seconds < 1:
+        return f'{seconds * 1e3:.2f}ms'
+    return f'{seconds:.3f}s'
+
+
+def print_result(result: dict) -> None:
+    print(
+        f'day{result["day"]:02}/part{result["part"]} {result["input"]}: '
+        f'min {format_seconds(result["min"])} '
+        f'median {format_seconds(result["median"])} '
+        f'p95 {format_seconds(result["p95"])}' + (f' peak {aoc.utils.memory.format_bytes(result["peak"])}' if result.get('peak') is not None else '')
+    )
+
+
+def write_json(path: pathlib.Path, results: list[dict], repeat: int, warmup: int) -> None:
+    out = {
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'warmup': warmup,
+        'results': results,
+    }
+    path.write_text(json.dumps(out, indent=2) + '\n')
+
+
+def load_baseline(path: pathlib.Path) -> dict[tuple[int, int, str], dict]:
+    baseline = json.loads(path.read_text())
+    return {(r['day'], r['part'], r.get('input', 'input.txt')): r for r in baseline['results']}
+
+
+def regressions(results: list[dict], baseline: dict[tuple[int, int, str], dict], threshold: float) -> list[str]:
+    # compare medians, the min is too sensitive to a single lucky run
+    found = []
+    for r in results:
+        base = baseline.get((r['day'], r['part'], r['input']))
+        if not base:
+            continue
+        ratio = r['median'] / base['median'] if base['median'] else 1.0
+        if ratio > 1 + threshold:
+            found.append(
+                f'day{r["day"]:02}/part{r["part"]} {r["input"]}: median {format_seconds(base["median"])} -> {format_seconds(r["median"])} ({(ratio - 1) * 100:+.1f}%)'
+            )
+    return found
+
+
+def print_history(db: sqlite3.Connection, days: list[int], parts: list[int], threshold: float) -> None:
+    for day, part, filename in aoc.utils.history.parts(db, days):
+        if part not in parts:
+            continue
+        print(f'\nday{day:02}/part{part} {filename}:')
+        previous = None
+        for row in aoc.utils.history.part_history(db, day, part, filename):
+            note = ''
+            if previous is None:
+                pass
+            elif row['input_hash'] != previous['input_hash']:
+                # a different input isn't comparable, start again from here
+                note = 'input changed'
+            elif previous['median']:
+                ratio = row['median'] / previous['median']
+                note = f'{(ratio - 1) * 100:+.1f}%'
+                if ratio > 1 + threshold:
+                    note += ' slower'
+            peak = aoc.utils.memory.format_bytes(row['peak']) if row['peak'] is not None else '-'
+            print(
+                f'  {row["created"]} {row["git_commit"] or "?":>16} py{row["python"]:<8} '
+                f'min {format_seconds(row["min"]):>10} median {format_seconds(row["median"]):>10} peak {peak:>10}  {note}'
+            )
+            previous = row
+
+
+def parse_history_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='bench.py history', description='Show the recorded benchmark runs, flagging where a part got slower')
+    parser.add_argument('days', nargs='*', type=int, help='days to show (default: all recorded)')
+    parser.add_argument('-p', '--part', type=int, choices=aoc.utils.days.parts, action='append', help='part to show (default: both)')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1, help='slowdown against the previous run to flag (default: 0.1 = 10%%)')
+    parser.add_argument('--history-db', type=pathlib.Path, default=aoc.utils.history.default_path(), help='SQLite database of runs (default: %(default)s)')
+    return parser.parse_args(argv)
+
+
+def history_main(argv: list[str]) -> None:
+    args = parse_history_args(argv)
+    if not args.history_db.exists():
+        print(f'no benchmark history in {args.history_db}', file=sys.stderr)
+        sys.exit(1)
+    db = aoc.utils.history.connect(args.history_db)
+    print_history(db, args.days, args.part or list(aoc.utils.days.parts), args.threshold)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark each day\'s part1 and part2, or "history" to show past runs')
+    parser.add_argument('days', nargs='*', type=int, help='days to benchmark (default: all available)')
+    parser.add_argument('-p', '--part', type=int, choices=aoc.utils.days.parts, action='append', help='part to benchmark (default: both)')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='timed runs per part (default: 5)')
+    parser.add_argument('-w', '--warmup', type=int, default=1, help='untimed runs per part before timing (default: 1)')
+    parser.add_argument('-i', '--input', metavar='FILENAME', default='input.txt', help='read data/dayNN/FILENAME (default: input.txt)')
+    parser.add_argument(
+        '-s',
+        '--scales',
+        type=int,
+        nargs='+',
+        metavar='K',
+        help='benchmark on generated scaleK.txt inputs instead, making any that are missing, and report how time grows with size',
+    )
+    parser.add_argument('--seed', type=int, default=aoc.gen.run.default_seed, help='random seed for generated inputs')
+    parser.add_argument('-o', '--output', type=pathlib.Path, help='write the results as JSON to this file')
+    parser.add_argument('-b', '--baseline', type=pathlib.Path, help='compare against a JSON file written by --output')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1, help='allowed slowdown against the baseline (default: 0.1 = 10%%)')
+    parser.add_argument('-m', '--memory', action='store_true', help='also measure peak traced memory, in one extra run per part')
+    parser.add_argument('--history-db', type=pathlib.Path, default=aoc.utils.history.default_path(), help='SQLite database of runs (default: %(default)s)')
+    parser.add_argument('--no-history', action='store_true', help="don't record this run in the history database")
+    return parser.parse_args()
+
+
+def main() -> None:
+    if sys.argv[1:2] == ['history']:
+        history_main(sys.argv[2:])
+        return
+
+    args = parse_args()
+    days = args.days or aoc.utils.days.available_days()
+    parts = args.part or list(aoc.utils.days.parts)
+
+    inputs = [args.input]
+    if args.scales:
+        for day in days:
+            for scale in args.scales:
+                aoc.gen.run.ensure(day, scale, seed=args.seed)
+        inputs = [aoc.utils.paths.scale_filename(scale) for scale in args.scales]
+
+    results = bench(days, parts, args.repeat, args.warmup, inputs, memory=args.memory)
+    if args.scales:
+        print_scaling(results)
+
+    if results and not args.no_history:
+        aoc.utils.history.record(aoc.utils.history.connect(args.history_db), results)
+
+    if args.output:
+        write_json(args.output, results, args.repeat, args.warmup)
+
+    if args.baseline:
+        found = regressions(results, load_baseline(args.baseline), args.threshold)
+        if found:
+            print('\nRegressions:')
+            print('\n'.join(found))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
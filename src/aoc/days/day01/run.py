@@ -7,19 +7,20 @@ import operator
 import aoc.utils.data
 
 
-def sorted_columns(lines: list[list[int]]) -> tuple[list[int], list[int]]:
-    left = []
-    right = []
-    for line in lines:
-        left.append(line[0])
-        right.append(line[-1])
-    left_sorted = sorted(left)
-    right_sorted = sorted(right)
+def sorted_columns(ints: list[int]) -> tuple[list[int], list[int]]:
+    # the two columns alternate in the flat list of the input's integers, which is parsed in one pass
+    # and cached, so part 2 doesn't read the file again
+    left_sorted = sorted(ints[0::2])
+    right_sorted = sorted(ints[1::2])
     return left_sorted, right_sorted
 
 
+def load() -> list[int]:
+    return aoc.utils.data.day_input_all_ints(1)
+
+
 def part1() -> int:
-    left_sorted, right_sorted = sorted_columns(aoc.utils.data.day_input_ints(1))
+    left_sorted, right_sorted = sorted_columns(load())
     diffs = []
     for i in range(len(left_sorted)):
         diffs.append(abs(left_sorted[i] - right_sorted[i]))
@@ -27,7 +28,7 @@ def part1() -> int:
 
 
 def part2() -> int:
-    left_sorted, right_sorted = sorted_columns(aoc.utils.data.day_input_ints(1))
+    left_sorted, right_sorted = sorted_columns(load())
     count_cache = {}
     max_index = len(left_sorted)
     left_index = 0
@@ -56,6 +57,11 @@ def part2() -> int:
     return total
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(1, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day01:']
     p1 = part1()
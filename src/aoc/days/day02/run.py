@@ -35,7 +35,7 @@ def damp_good_line(line: list[int]) -> bool:
 
 def part1() -> int:
     count = 0
-    for line in aoc.utils.data.day_input_ints(2):
+    for line in aoc.utils.data.day_input_iter_ints(2):
         if good_line(line):
             count += 1
     return count
@@ -43,12 +43,17 @@ def part1() -> int:
 
 def part2() -> int:
     count = 0
-    for line in aoc.utils.data.day_input_ints(2):
+    for line in aoc.utils.data.day_input_iter_ints(2):
         if good_line(line) or damp_good_line(line):
             count += 1
     return count
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(2, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day02:']
     p1 = part1()
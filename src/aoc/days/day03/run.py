@@ -17,66 +17,32 @@ def process_mul(mul: str) -> int:
     return num1 * num2
 
 
-def extract_instructions(lines: list[str]) -> list[str]:
-    pattern = re.compile(r'(?P<mul>mul\(\d{1,3},\d{1,3}\))|(?P<do>do\(\))|(?P<dont>don\'t\(\))')
-    instructions = []
-    for line in lines:
-        pos = 0
-        line_length = len(line)
-        while True:
-            if pos >= line_length:
-                break
-            match = pattern.search(line, pos)
-            if match:
-                instructions.append(match[0])
-                pos = match.end()
-            else:
-                break
-    return instructions
+def part1() -> int:
+    pattern = re.compile(rb'mul\(\d{1,3},\d{1,3}\)')
+    count = 0
+    # a mul can't span lines so search the whole file at once
+    for match in pattern.finditer(aoc.utils.data.day_input_bytes(3)):
+        count += process_mul(match[0].decode())
+    return count
 
 
-def filter_instructions(instructions: list[str]) -> list[str]:
+def part2() -> int:
+    pattern = re.compile(rb'(?P<mul>mul\(\d{1,3},\d{1,3}\))|(?P<do>do\(\))|(?P<dont>don\'t\(\))')
     on = True
-    out = []
-    for ins in instructions:
-        if ins == "don't()":
+    count = 0
+    for match in pattern.finditer(aoc.utils.data.day_input_bytes(3)):
+        if match['dont']:
             on = False
-        elif ins == "do()":
+        elif match['do']:
             on = True
         elif on:
-            out.append(ins)
-    return out
-
-
-def part1() -> int:
-    pattern = re.compile(r'mul\(\d{1,3},\d{1,3}\)')
-    muls = []
-    for line in aoc.utils.data.day_input_lines(3):
-        pos = 0
-        line_length = len(line)
-        while True:
-            if pos >= line_length:
-                break
-            match = pattern.search(line, pos)
-            if match:
-                muls.append(match[0])
-                pos = match.end()
-            else:
-                break
-    count = 0
-    for m in muls:
-        count += process_mul(m)
+            count += process_mul(match[0].decode())
     return count
 
 
-def part2() -> int:
-    lines = aoc.utils.data.day_input_lines(3)
-    instructions = extract_instructions(lines)
-    instructions = filter_instructions(instructions)
-    count = 0
-    for m in instructions:
-        count += process_mul(m)
-    return count
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(3, text):
+        return part1(), part2()
 
 
 def main() -> None:
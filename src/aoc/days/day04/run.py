@@ -118,6 +118,10 @@ def is_xmas(
     return p1 in ['MS', 'SM'] and p2 in ['MS', 'SM']
 
 
+def load() -> list[list[str]]:
+    return aoc.utils.data.day_input_grid(4)
+
+
 def part1() -> int:
     directions = [
         [1, 0],
@@ -129,7 +133,7 @@ def part1() -> int:
         [0, -1],
         [1, -1],
     ]
-    grid = aoc.utils.data.day_input_grid(4)
+    grid = load()
     grid_width, grid_height = grid_to_width_height(grid)
     count = 0
     found_paths = []
@@ -146,7 +150,7 @@ def part1() -> int:
 
 
 def part2() -> int:
-    grid = aoc.utils.data.day_input_grid(4)
+    grid = load()
     grid_width, grid_height = grid_to_width_height(grid)
     count = 0
     for row_index in range(grid_height):
@@ -156,6 +160,11 @@ def part2() -> int:
     return count
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(4, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day04:']
     p1 = part1()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import pathlib
+
 import aoc.utils.data
 
 
@@ -55,6 +57,11 @@ def split_input(lines: list[str]) -> tuple[list[str], list[str]]:
     return rules, updates
 
 
+def load_input(path: pathlib.Path) -> tuple[dict, list[list[int]]]:
+    rule_lines, update_lines = aoc.utils.data.readsections(path)
+    return parse_rules(rule_lines), parse_updates(update_lines)
+
+
 def order_ok(rules: dict, before: int, after: int) -> bool:
     if before in rules and after in rules[before]['after']:
         return False
@@ -149,11 +156,12 @@ def print_rules(rules: dict) -> None:
         print(f'{p} after {rules[p]["after"]}')
 
 
+def load() -> tuple[dict, list[list[int]]]:
+    return aoc.utils.data.day_input_persisted(5, load_input, version=1)
+
+
 def part1() -> int:
-    lines = aoc.utils.data.day_input_lines(5)
-    rule_lines, update_lines = split_input(lines)
-    rules = parse_rules(rule_lines)
-    updates = parse_updates(update_lines)
+    rules, updates = load()
     updates = filter_updates(rules, updates)
     count = 0
     for u in updates:
@@ -163,10 +171,7 @@ def part1() -> int:
 
 
 def part2() -> int:
-    lines = aoc.utils.data.day_input_lines(5)
-    rule_lines, update_lines = split_input(lines)
-    rules = parse_rules(rule_lines)
-    updates = parse_updates(update_lines)
+    rules, updates = load()
     updates = filter_bad_updates(rules, updates)
     updates = fix_updates(rules, updates)
     count = 0
@@ -176,6 +181,11 @@ def part2() -> int:
     return count
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(5, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day05:']
     p1 = part1()
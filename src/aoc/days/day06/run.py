@@ -6,6 +6,7 @@ import enum
 import sys
 
 import aoc.utils.data
+import aoc.utils.instrument
 
 Point = collections.namedtuple('Point', ['x', 'y'])
 Node = collections.namedtuple('Node', ['x', 'y', 'direction'])
@@ -63,10 +64,11 @@ class Grid:
         self.size_grid()
 
     def load_input(self) -> None:
-        self.grid = aoc.utils.data.day_input_grid(6)
+        # a copy, obstructions are added to it
+        self.grid = aoc.utils.data.copy_parsed(load())
 
     def load_test(self) -> None:
-        self.grid = aoc.utils.data.day_test_grid(6)
+        self.grid = aoc.utils.data.copy_parsed(aoc.utils.data.day_test_grid(6))
 
     def size_grid(self) -> None:
         self.width = len(self.grid[0])
@@ -160,6 +162,7 @@ class Guard:
 
         return any(not visited[k] and self.cyclic(k, visited, recursed) for k in nodes)
 
+    @aoc.utils.instrument.region
     def move(self, grid: Grid) -> None:
         nextp = self.next_point()
 
@@ -205,6 +208,10 @@ class Guard:
         return len(path_set)
 
 
+def load() -> list[list[str]]:
+    return aoc.utils.data.day_input_grid(6)
+
+
 def part1() -> int:
     grid = Grid()
     guard_position = grid.guard_position()
@@ -233,8 +240,18 @@ def part2() -> int:
     return found
 
 
-def main() -> None:
+def setup() -> None:
     sys.setrecursionlimit(10**4)
+
+
+def solve(text: str) -> tuple[int, int]:
+    setup()
+    with aoc.utils.data.input_text(6, text):
+        return part1(), part2()
+
+
+def main() -> None:
+    setup()
     lines = ['day06:']
     p1 = part1()
     lines.append(f'part 1: {p1}')
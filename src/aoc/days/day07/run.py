@@ -19,7 +19,14 @@ operator_map = {
     '|': concat
 }
 
-perm_cache = {}
+
+def distinct_permutations(combination: tuple[str, ...]) -> list[list[str]]:
+    perms = []
+    for p in itertools.permutations(combination, len(combination)):
+        p = list(p)
+        if p not in perms:
+            perms.append(p)
+    return perms
 
 
 class Equation:
@@ -59,19 +66,12 @@ class Equation:
         # build caches
         for c in itertools.combinations_with_replacement(self.operators, num_combs):
             combs.append(c)
-            if c in perm_cache:
-                continue
-            perm_cache[c] = list()
-            for p in itertools.permutations(c, num_combs):
-                p = list(p)
-                if p not in perm_cache[c]:
-                    perm_cache[c].append(p)
 
         tried = []
         attempt = 0
         bad_ops = []
         for c in combs:
-            for p in perm_cache[c]:
+            for p in distinct_permutations(c):
                 if p in tried:
                     continue
 
@@ -151,6 +151,12 @@ def part2() -> int:
             total += e.target
     return total
 
+
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(7, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day07:']
     p1 = part1()
@@ -210,21 +210,30 @@ def print_nodes(grid: list[list[str]], nodes: list[list[int]]) -> None:
         print(''.join(row))
 
 
+def load() -> list[list[str]]:
+    return aoc.utils.data.day_input_grid(8)
+
+
 def part1() -> int:
-    grid = aoc.utils.data.day_input_grid(8)
+    grid = load()
     locations = parse_grid(grid)
     nodes = find_nodes(grid, locations)
     return len(nodes)
 
 
 def part2() -> int:
-    grid = aoc.utils.data.day_input_grid(8)
+    grid = load()
     locations = parse_grid(grid)
     nodes = find_nodes(grid, locations, resonant=True)
     # print_nodes(grid, nodes)
     return len(nodes)
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(8, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day08:']
     p1 = part1()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import aoc.utils.data
+import aoc.utils.instrument
 
 
 def is_even(index: int) -> bool:
@@ -171,6 +172,7 @@ class Disk2:
             gaps[length].append(sid)
         return gaps
 
+    @aoc.utils.instrument.region
     def coalesce_spaces(self, spaces):
         new_spaces = {}
         new_space_id = 0
@@ -288,6 +290,11 @@ def part2() -> int:
     return disk.checksum()
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(9, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day09:']
     p1 = part1()
@@ -2,6 +2,11 @@
 from __future__ import annotations
 
 import aoc.utils.data
+import aoc.utils.grid
+
+# heights are the ascii digits, padding is 0 so the border never matches
+trailhead = ord('0')
+summit = ord('9')
 
 
 def value(grid: list[list[int]], point: list[int]) -> int:
@@ -57,34 +62,53 @@ def find(grid: list[list[int]], path: list[list[int]], found: list[list[list[int
     return found
 
 
+def flat_summits(grid: aoc.utils.grid.FlatGrid, index: int) -> set[int]:
+    if grid[index] == summit:
+        return {index}
+    found = set()
+    next_value = grid[index] + 1
+    for n in grid.neighbours(index):
+        if grid[n] == next_value:
+            found |= flat_summits(grid, n)
+    return found
+
+
+def flat_trails(grid: aoc.utils.grid.FlatGrid, index: int) -> int:
+    if grid[index] == summit:
+        return 1
+    count = 0
+    next_value = grid[index] + 1
+    for n in grid.neighbours(index):
+        if grid[n] == next_value:
+            count += flat_trails(grid, n)
+    return count
+
+
+def load() -> aoc.utils.grid.FlatGrid:
+    return aoc.utils.data.day_input_flatgrid(10)
+
+
 def part1() -> int:
-    grid = aoc.utils.data.day_input_grid_ints(10)
-    summits = []
-    for row_index, row in enumerate(grid):
-        for column_index, column in enumerate(row):
-            if column == 0:
-                found = climb(grid, [column_index, row_index])
-                if found:
-                    summits.extend(found)
-    return len(summits)
+    grid = load()
+    total = 0
+    for index in grid.find(trailhead):
+        total += len(flat_summits(grid, index))
+    return total
 
 
 def part2() -> int:
-    grid = aoc.utils.data.day_input_grid_ints(10)
-    paths = {}
-    for row_index, row in enumerate(grid):
-        for column_index, column in enumerate(row):
-            if column == 0:
-                point = [column_index, row_index]
-                path = [point]
-                found = find(grid, path)
-                paths[f'{column_index},{row_index}'] = found
+    grid = load()
     total = 0
-    for _, v in paths.items():
-        total += len(v)
+    for index in grid.find(trailhead):
+        total += flat_trails(grid, index)
     return total
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(10, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day10:']
     p1 = part1()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import aoc.utils.cache
 import aoc.utils.data
 
 
@@ -61,6 +62,15 @@ def generate(s: int, loops: int, splits: int = 0) -> int:
     return splits
 
 
+# a scale 1 input's 25 blinks need about 7000 entries
+@aoc.utils.cache.memoize(maxsize=1 << 14)
+def count_stones(s: int, blinks: int) -> int:
+    # how many stones s becomes, the same few numbers come up again and again
+    if blinks == 0:
+        return 1
+    return sum(count_stones(e, blinks - 1) for e in evolve(s))
+
+
 def blink(stones: dict) -> dict:
     out = {}
     for s, count in stones.items():
@@ -76,6 +86,10 @@ def blink(stones: dict) -> dict:
     return out
 
 
+def load() -> list[int]:
+    return aoc.utils.data.day_input_ints(11)[0]
+
+
 def part1_test() -> int:
     splits = 0
     input = [125, 17]
@@ -84,16 +98,21 @@ def part1_test() -> int:
     return splits + len(input)
 
 
-def part1() -> int:
-    stones = aoc.utils.data.day_input_ints(11)[0]
+def part1_generate() -> int:
+    stones = load()
     splits = 0
     for s in stones:
         splits += generate(s, 25)
     return splits + len(stones)
 
 
+def part1() -> int:
+    stones = load()
+    return sum(count_stones(s, 25) for s in stones)
+
+
 def part2_split() -> int:
-    stones = aoc.utils.data.day_input_ints(11)[0]
+    stones = load()
     splits = 0
     for s in stones:
         splits += generate(s, 75)
@@ -101,7 +120,7 @@ def part2_split() -> int:
 
 
 def part2() -> int:
-    stone_list = aoc.utils.data.day_input_ints(11)[0]
+    stone_list = load()
     stones = {}
     for s in stone_list:
         stones[s] = 1
@@ -110,6 +129,11 @@ def part2() -> int:
     return sum(stones.values())
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(11, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day11:']
     p1 = part1()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import aoc.utils.data
 import aoc.utils.grid
+import aoc.utils.instrument
 import aoc.utils.types
 
 """
@@ -345,6 +346,7 @@ class Region:
         return total
 
 
+@aoc.utils.instrument.region
 def region_points(
     grid: list[list[str]],
     plant: str,
@@ -390,8 +392,12 @@ def grid_to_regions(grid: list[list[str]]) -> list[Region]:
     return regions
 
 
+def load() -> list[list[str]]:
+    return aoc.utils.data.day_input_grid(12)
+
+
 def part1() -> int:
-    grid = aoc.utils.data.day_input_grid(12)
+    grid = load()
     regions = grid_to_regions(grid)
     total = 0
     for r in regions:
@@ -400,14 +406,21 @@ def part1() -> int:
 
 
 def part2() -> int:
-    grid = aoc.utils.data.day_input_grid(12)
-    regions = grid_to_regions(grid)
+    grid = load()
+    with aoc.utils.instrument.timed('part2 find regions'):
+        regions = grid_to_regions(grid)
     total = 0
-    for r in regions:
-        total += r.area() * r.sides(grid)
+    with aoc.utils.instrument.timed('part2 count sides'):
+        for r in regions:
+            total += r.area() * r.sides(grid)
     return total
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(12, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day12:']
     p1 = part1()
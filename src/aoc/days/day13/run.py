@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
-import random
-
 import aoc.utils.data
 import aoc.utils.grid
+import aoc.utils.lazy
 import aoc.utils.types
 
+# only the recursive search shuffles, and the parts don't use it
+random = aoc.utils.lazy.lazy_import('random')
+
 """
 px = A.x * a + B.x * b
 py = A.y * a + B.y * b
@@ -232,6 +234,11 @@ def part2() -> int:
     return costs
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(13, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day13:']
     p1 = part1()
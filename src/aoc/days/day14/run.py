@@ -167,6 +167,11 @@ def part2() -> int:
     return ticks
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(14, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day14:']
     p1 = part1()
@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
-import curses
-
 import aoc.utils.data
 import aoc.utils.grid
+import aoc.utils.lazy
 import aoc.utils.types
 
+# only for the visualisation
+curses = aoc.utils.lazy.lazy_import('curses')
+
 
 class Position:
     def __init__(self, x: int, y: int) -> None:
@@ -476,9 +478,12 @@ def break_lines(lines: list[str]) -> tuple[list[str], list[str]]:
     return grid_lines, instructions
 
 
+def load() -> list[list[str]]:
+    return aoc.utils.data.day_input_sections(15)
+
+
 def part1() -> int:
-    lines = aoc.utils.data.day_input_lines(15)
-    grid_lines, instructions = break_lines(lines)
+    grid_lines, instructions = load()
     grid = lines_to_grid(grid_lines)
     instructions = ''.join(instructions)
     grid.execute(instructions)
@@ -486,16 +491,19 @@ def part1() -> int:
 
 
 def part2() -> int:
-    # lines = aoc.utils.data.day_test_lines(15, which=2)
-    lines = aoc.utils.data.day_input_lines(15)
-
-    grid_lines, instructions = break_lines(lines)
+    # grid_lines, instructions = aoc.utils.data.day_test_sections(15, which=2)
+    grid_lines, instructions = load()
     grid = lines_to_grid2(grid_lines)
     instructions = ''.join(instructions)
     grid.execute(instructions)
     return grid.gps()
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(15, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day15:']
     p1 = part1()
@@ -2,15 +2,19 @@
 from __future__ import annotations
 
 import collections
-import curses
 import heapq
 import sys
 import time
 
 import aoc.utils.data
 import aoc.utils.grid
+import aoc.utils.lazy
+import aoc.utils.search
 import aoc.utils.types
 
+# only for the visualisation
+curses = aoc.utils.lazy.lazy_import('curses')
+
 direction_to_vector = {
     'N': aoc.utils.types.Position(0, -1),
     'S': aoc.utils.types.Position(0, 1),
@@ -33,6 +37,10 @@ direction_to_char = {
 }
 
 
+# facing in a search state, clockwise
+state_directions = 'NESW'
+
+
 def direction_rotate_right(direction: str) -> str:
     directions = {
         'N': 'E',
@@ -141,6 +149,9 @@ class Grid:
         self.height = len(grid)
         self.max_width = self.width - 1
         self.max_height = self.height - 1
+        # the grid by cell, 1 for a space, and the step to the next cell facing N E S W
+        self.spaces = bytearray(c != '#' for row in self.grid for c in row)
+        self.state_steps = (-self.width, 1, self.width, -1)
 
     def print_grid(self, current: aoc.utils.types.Position, direction: str, end: aoc.utils.types.Position) -> None:
         print('\n'.join(self.print_lines(current, direction, end)))
@@ -654,13 +665,56 @@ class Grid:
 
         return best_end_cost, best_seats
 
+    def state(self, position: aoc.utils.types.Position, direction: str) -> int:
+        # position and facing in one int, for aoc.utils.search
+        return (position.y * self.width + position.x) * 4 + state_directions.index(direction)
+
+    def state_neighbours(self, state: int) -> list[tuple[int, int]]:
+        cell, facing = divmod(state, 4)
+        ns = [
+            # rotate left and right
+            (cell * 4 + (facing - 1) % 4, 1000),
+            (cell * 4 + (facing + 1) % 4, 1000),
+        ]
+        forward_cell = cell + self.state_steps[facing]
+        if self.spaces[forward_cell]:
+            ns.append((forward_cell * 4 + facing, 1))
+        return ns
+
+    def search(self, stop_at_end: bool, all_predecessors: bool = False) -> tuple[aoc.utils.search.SearchResult, list[int]]:
+        ends = [self.state(self.end, d) for d in state_directions]
+        result = aoc.utils.search.dijkstra(
+            len(self.spaces) * 4,
+            [self.state(self.start, 'E')],
+            self.state_neighbours,
+            targets=set(ends) if stop_at_end else (),
+            all_predecessors=all_predecessors,
+        )
+        return result, ends
+
     def run(self) -> int:
+        result, _ = self.search(True)
+        if result.found():
+            return result.distance[result.target]
+        return 0
+
+    def run2(self) -> int:
+        # search everything, the end can be reached facing more than one way at the best cost
+        result, ends = self.search(False, all_predecessors=True)
+        reached = [e for e in ends if result.reached(e)]
+        if not reached:
+            return 0
+        best = min(result.distance[e] for e in reached)
+        states = result.on_shortest_paths([e for e in reached if result.distance[e] == best])
+        return len({state // 4 for state in states})
+
+    def run_astar(self) -> int:
         path, cost = self.astar(self.start, self.end)
         if path:
             return cost
         return 0
 
-    def run2(self) -> int:
+    def run2_dijkstra3(self) -> int:
         _, best_seats = self.dijkstra3(self.start, self.end)
         return len(best_seats)
 
@@ -726,8 +780,18 @@ def part2() -> int:
     return grid.run2()
 
 
-def main() -> None:
+def setup() -> None:
     sys.setrecursionlimit(10**5)
+
+
+def solve(text: str) -> tuple[int, int]:
+    setup()
+    with aoc.utils.data.input_text(16, text):
+        return part1(), part2()
+
+
+def main() -> None:
+    setup()
     lines = ['day16:']
     p1 = part1()
     lines.append(f'part 1: {p1}')
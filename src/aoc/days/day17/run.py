@@ -4,6 +4,7 @@ from __future__ import annotations
 import operator
 
 import aoc.utils.data
+import aoc.utils.instrument
 
 
 class HaltException(Exception):
@@ -50,6 +51,7 @@ class Computer:
         while self.instruction_pointer < program_length - 1:
             self.execute(self.instruction_pointer)
 
+    @aoc.utils.instrument.region
     def execute(self, ip: int) -> None:
         opcode = self.program[ip]
         func_name = self.opcode_to_instruction[opcode]
@@ -218,6 +220,11 @@ def part2() -> int:
     return find_digits(parsed_input, 0, 1)
 
 
+def solve(text: str) -> tuple[str, int]:
+    with aoc.utils.data.input_text(17, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day17:']
     p1 = part1()
@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
-import heapq
-
+import aoc.utils.bitgrid
 import aoc.utils.data
+import aoc.utils.instrument
+import aoc.utils.search
 import aoc.utils.types
 
 direction_to_vector = {
@@ -24,6 +25,8 @@ class Grid:
         self.max_width = size - 1
         self.max_height = size - 1
         self.grid = self.make_grid()
+        # the grid by state, 1 for a space
+        self.spaces = bytearray(c != '#' for row in self.grid for c in row)
 
     def make_grid(self) -> list[list[str]]:
         grid = []
@@ -60,51 +63,29 @@ class Grid:
     def is_wall(self, position: aoc.utils.types.Position) -> bool:
         return self.grid[position.y][position.x] == '#'
 
+    def state(self, position: aoc.utils.types.Position) -> int:
+        return position.y * self.width + position.x
+
+    def position(self, state: int) -> aoc.utils.types.Position:
+        return aoc.utils.types.Position(state % self.width, state // self.width)
+
+    def state_neighbours(self, state: int) -> list[int]:
+        # same order as neighbours(), N S E W
+        ns = []
+        x = state % self.width
+        for n in (state - self.width, state + self.width, state + 1 if x < self.max_width else -1, state - 1 if x > 0 else -1):
+            if 0 <= n < len(self.spaces) and self.spaces[n]:
+                ns.append(n)
+        return ns
+
+    @aoc.utils.instrument.region
     def shortest_path(self) -> list[aoc.utils.types.Position] | None:
         start = aoc.utils.types.Position(0, 0)
         end = aoc.utils.types.Position(self.max_width, self.max_height)
-
-        # init
-
-        # costs
-        distances = {}
-        previous = {}
-        for n in self.nodes():
-            distances[n] = float('inf')
-            previous[n] = None
-        distances[start] = 0
-
-        # priority queue
-        pq = [(0, start)]
-        found = False
-        while pq:
-            current_distance, current_pos = heapq.heappop(pq)
-
-            # If we've reached the end, we can stop
-            if current_pos == end:
-                found = True
-                break
-
-            # If the distance we have is greater than what we've already processed, skip
-            if current_distance > distances[current_pos]:
-                continue
-
-            # Check all four directions
-            for next_pos in self.neighbours(current_pos):
-                distance = current_distance + 1
-                if distance < distances[next_pos]:
-                    distances[next_pos] = distance
-                    previous[next_pos] = current_pos
-                    heapq.heappush(pq, (distance, next_pos))
-
-        if found:
-            # Reconstruct the path
-            path = []
-            current = end
-            while current:
-                path.append(current)
-                current = previous[current]
-            return path[::-1]
+        result = aoc.utils.search.bfs(len(self.spaces), [self.state(start)], self.state_neighbours, targets={self.state(end)})
+        path = result.path()
+        if path:
+            return [self.position(s) for s in path]
         return None
 
 
@@ -116,13 +97,36 @@ def lines_to_bites(lines: list[str]) -> list[aoc.utils.types.Position]:
     return bites
 
 
+def grid_size(bites: list[aoc.utils.types.Position]) -> int:
+    # 71 for the puzzle input, larger for generated ones
+    return max(max(b.x, b.y) for b in bites) + 1
+
+
+def first_blocked(bites: list[aoc.utils.types.Position], size: int, fallen: int) -> int:
+    # once the exit is cut off it stays cut off, so binary search the number of fallen bytes, only
+    # asking whether the exit can be reached, which the bitgrid floods a whole frontier at a time
+    grid = aoc.utils.bitgrid.BitGrid(size, size)
+    start = grid.bit(0, 0)
+    end = grid.bit(size - 1, size - 1)
+    low = fallen
+    high = len(bites)
+    while low < high:
+        middle = (low + high) // 2
+        spaces = grid.mask & ~grid.layer(bites[:middle])
+        if grid.flood(start, spaces) & end:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
 def part1() -> int:
     # return 0
     # lines = aoc.utils.data.day_test_lines(18, which=0)
     lines = aoc.utils.data.day_input_lines(18)
     bites = lines_to_bites(lines)
     # grid = Grid(bites, 7, 12)
-    grid = Grid(bites, 71, 1024)
+    grid = Grid(bites, grid_size(bites), 1024)
     path = grid.shortest_path()
     if path:
         return len(path) - 1
@@ -134,10 +138,17 @@ def part2() -> str:
     # lines = aoc.utils.data.day_test_lines(18, which=0)
     lines = aoc.utils.data.day_input_lines(18)
     bites = lines_to_bites(lines)
-    blocked = False
     # fallen = 13
+    fallen = first_blocked(bites, grid_size(bites), 1025)
+    return str(bites[fallen - 1])
+
+
+def part2_search() -> str:
+    lines = aoc.utils.data.day_input_lines(18)
+    bites = lines_to_bites(lines)
+    blocked = False
     fallen = 1025
-    size = 71
+    size = grid_size(bites)
     while not blocked:
         grid = Grid(bites, size, fallen)
         path = grid.shortest_path()
@@ -147,6 +158,11 @@ def part2() -> str:
     return str(bites[fallen - 1])
 
 
+def solve(text: str) -> tuple[int, str]:
+    with aoc.utils.data.input_text(18, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day18:']
     p1 = part1()
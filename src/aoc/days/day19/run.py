@@ -192,6 +192,11 @@ def part2() -> int:
     return sum(lengths)
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(19, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['day19:']
     p1 = part1()
@@ -4,6 +4,7 @@ from __future__ import annotations
 import heapq
 
 import aoc.utils.data
+import aoc.utils.search
 import aoc.utils.types
 
 direction_to_vector = {
@@ -31,6 +32,8 @@ class Grid:
         self.height = len(grid)
         self.max_width = self.width - 1
         self.max_height = self.height - 1
+        # the grid by state, 1 for a space
+        self.spaces = bytearray(c != '#' for row in self.grid for c in row)
 
     def nodes(self) -> list[aoc.utils.types.Position]:
         nodes = []
@@ -141,52 +144,30 @@ class Grid:
     def are_spaces(self, positions: list[aoc.utils.types.Position]) -> bool:
         return all([self.is_space(p) for p in positions])
 
+    def state(self, position: aoc.utils.types.Position) -> int:
+        return position.y * self.width + position.x
+
+    def position(self, state: int) -> aoc.utils.types.Position:
+        return aoc.utils.types.Position(state % self.width, state // self.width)
+
+    def state_neighbours(self, state: int) -> list[int]:
+        ns = []
+        x = state % self.width
+        for n in (state - self.width, state + self.width, state + 1 if x < self.max_width else -1, state - 1 if x > 0 else -1):
+            if 0 <= n < len(self.spaces) and self.spaces[n]:
+                ns.append(n)
+        return ns
+
     def shortest_path(
         self,
         start: aoc.utils.types.Position,
         end: aoc.utils.types.Position,
     ) -> tuple[list[aoc.utils.types.Position] | None, dict]:
-        # init
-
-        # costs
-        distances = {}
-        previous = {}
-        for n in self.nodes():
-            distances[n] = float('inf')
-            previous[n] = None
-        distances[start] = 0
-
-        # priority queue
-        pq = [(0, start)]
-        found = False
-        while pq:
-            current_distance, current_pos = heapq.heappop(pq)
-
-            # If we've reached the end, we can stop
-            if current_pos == end:
-                found = True
-                break
-
-            # If the distance we have is greater than what we've already processed, skip
-            if current_distance > distances[current_pos]:
-                continue
-
-            # Check all four directions
-            for next_pos in self.neighbours(current_pos):
-                distance = current_distance + 1
-                if distance < distances[next_pos]:
-                    distances[next_pos] = distance
-                    previous[next_pos] = current_pos
-                    heapq.heappush(pq, (distance, next_pos))
-
-        if found:
-            # Reconstruct the path
-            path = []
-            current = end
-            while current:
-                path.append(current)
-                current = previous[current]
-            return path[::-1], distances
+        result = aoc.utils.search.bfs(len(self.spaces), [self.state(start)], self.state_neighbours, targets={self.state(end)})
+        distances = {self.position(s): d for s, d in enumerate(result.distance) if d != aoc.utils.search.unreached}
+        path = result.path()
+        if path:
+            return [self.position(s) for s in path], distances
         return None, distances
 
     def shortest_path_remove(
@@ -414,6 +395,11 @@ def part2() -> int:
     return grid.find_cheats3(100, 20)
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(20, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['20:']
     p1 = part1()
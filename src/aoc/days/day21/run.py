@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import heapq
 
+import aoc.utils.cache
 import aoc.utils.data
 import aoc.utils.types
 
@@ -433,15 +434,13 @@ def print_moves(moves: dict, desc: str) -> None:
 
 
 # https://github.com/oshlern/adventofcode/blob/main/advent24/2024/python/18/concise.py
-def calc_fewest(code, N_ROBOT_KEYBOARDS):
+# the table only depends on the number of keyboards, so it's worked out once rather than for every code
+@aoc.utils.cache.memoize(maxsize=4)
+def leg_lengths_table(N_ROBOT_KEYBOARDS):
     KEY_COORDS = {c: (x, y) for y, row in enumerate([' ^A', '<v>']) for x, c in enumerate(row)}
     # Fewest of MY presses to hit kf when starting at ki (at layer 0)
     leg_lengths = {(0, ki, kf): 1 for ki in KEY_COORDS for kf in KEY_COORDS}
 
-    # Fewest of MY presses to hit all ks when starting at A (at layer l)
-    def fewest_presses(la, ks):
-        return sum(leg_lengths[la, ki, kf] for ki, kf in zip('A' + ks, ks))
-
     for layer in range(1, N_ROBOT_KEYBOARDS + 1):
         if layer == N_ROBOT_KEYBOARDS:
             KEY_COORDS = {c: (x, y) for y, row in enumerate(['789', '456', '123', ' 0A']) for x, c in enumerate(row)}
@@ -449,10 +448,19 @@ def calc_fewest(code, N_ROBOT_KEYBOARDS):
             for kf, (xf, yf) in KEY_COORDS.items():
                 hor_ks = ('>' if xf > xi else '<') * abs(xf - xi)
                 ver_ks = ('^' if yf < yi else 'v') * abs(yf - yi)
-                fewest_hor_first = fewest_presses(layer - 1, hor_ks + ver_ks + 'A') if (xf, yi) != KEY_COORDS[' '] else float('inf')
-                fewest_ver_first = fewest_presses(layer - 1, ver_ks + hor_ks + 'A') if (xi, yf) != KEY_COORDS[' '] else float('inf')
+                fewest_hor_first = fewest_presses(leg_lengths, layer - 1, hor_ks + ver_ks + 'A') if (xf, yi) != KEY_COORDS[' '] else float('inf')
+                fewest_ver_first = fewest_presses(leg_lengths, layer - 1, ver_ks + hor_ks + 'A') if (xi, yf) != KEY_COORDS[' '] else float('inf')
                 leg_lengths[(layer, ki, kf)] = min(fewest_hor_first, fewest_ver_first)
-    return fewest_presses(layer, code)
+    return leg_lengths
+
+
+# Fewest of MY presses to hit all ks when starting at A (at layer l)
+def fewest_presses(leg_lengths, la, ks):
+    return sum(leg_lengths[la, ki, kf] for ki, kf in zip('A' + ks, ks))
+
+
+def calc_fewest(code, N_ROBOT_KEYBOARDS):
+    return fewest_presses(leg_lengths_table(N_ROBOT_KEYBOARDS), N_ROBOT_KEYBOARDS, code)
 
 
 def part1() -> int:
@@ -504,9 +512,19 @@ def part2() -> int:
     return total
 
 
-def main() -> None:
+def setup() -> None:
     make_numeric_moves()
     make_directional_moves()
+
+
+def solve(text: str) -> tuple[int, int]:
+    setup()
+    with aoc.utils.data.input_text(21, text):
+        return part1(), part2()
+
+
+def main() -> None:
+    setup()
     # print_moves(numeric_moves, 'numeric')
     # print_moves(directional_moves, 'directional')
 
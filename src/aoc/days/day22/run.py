@@ -60,12 +60,17 @@ def process(start: int, steps: int) -> int:
     return current
 
 
+def load() -> list[int]:
+    return aoc.utils.data.day_input_all_ints(22)
+
+
 def part1() -> int:
     # return 0
     total = 0
     # lines = aoc.utils.data.day_test_lines(22)
-    lines = aoc.utils.data.day_input_lines(22)
-    for line in lines:
+    for line in aoc.utils.data.day_input_iter_lines(22):
+        if not line:
+            continue
         num = int(line)
         total += process(num, 2000)
     return total
@@ -74,11 +79,9 @@ def part1() -> int:
 def part2() -> int:
     # return 0
     # lines = aoc.utils.data.day_test_lines(22, which=2)
-    lines = aoc.utils.data.day_input_lines(22)
     buyers = []
     seqs = set()
-    for line in lines:
-        num = int(line)
+    for num in load():
         b = Buyer(num, 2000)
         buyers.append(b)
         bs = set(b.seqs.keys())
@@ -93,6 +96,11 @@ def part2() -> int:
     return max(totals)
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(22, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['22:']
     p1 = part1()
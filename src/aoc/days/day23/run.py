@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import itertools
+import pathlib
 
 import aoc.utils.data
 
@@ -31,6 +32,10 @@ def lines_to_adj_list(lines: list[str]) -> dict:
     return graph
 
 
+def load_graph(path: pathlib.Path) -> dict:
+    return lines_to_adj_list(aoc.utils.data.readlines(path))
+
+
 def find_largest_connected_set(graph):
     def dfs(node, visited):
         stack = [node]
@@ -104,12 +109,15 @@ def find_all_cliques(graph):
     return largest_clique
 
 
+def load() -> dict:
+    return aoc.utils.data.day_input_persisted(23, load_graph, version=1)
+
+
 def part1() -> int:
     # return 0
     total = 0
     # lines = aoc.utils.data.day_test_lines(23)
-    lines = aoc.utils.data.day_input_lines(23)
-    graph = lines_to_adj_list(lines)
+    graph = load()
     triangles = find_triangles(graph)
     for t in triangles:
         for n in t:
@@ -122,12 +130,16 @@ def part1() -> int:
 def part2() -> str:
     # return ''
     # lines = aoc.utils.data.day_test_lines(23)
-    lines = aoc.utils.data.day_input_lines(23)
-    graph = lines_to_adj_list(lines)
+    graph = load()
     largest_component = find_all_cliques(graph)
     return ','.join(sorted(largest_component))
 
 
+def solve(text: str) -> tuple[int, str]:
+    with aoc.utils.data.input_text(23, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['23:']
     p1 = part1()
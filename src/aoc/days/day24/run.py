@@ -177,9 +177,11 @@ def wrong_wires(lines: list[str]) -> set:
     # https://www.caretxdigital.com/
     wrong = set()
     operations = parse_ops(lines)
+    # z45 for the puzzle input
+    top_bit = max((res for _, _, _, res in operations if res[0] == 'z'), key=lambda r: int(r[1:]))
     for op1, op, op2, res in operations:
         # z output must be xor apart from the top bit
-        if res[0] == 'z' and op != 'XOR' and res != 'z45':
+        if res[0] == 'z' and op != 'XOR' and res != top_bit:
             wrong.add(res)
 
         # xor gates which don't have x,y inputs and not a z output
@@ -219,6 +221,11 @@ def part2() -> str:
     return ','.join(sorted(list(wrong)))
 
 
+def solve(text: str) -> tuple[int, str]:
+    with aoc.utils.data.input_text(24, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['24:']
     p1 = part1()
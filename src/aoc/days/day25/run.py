@@ -85,6 +85,11 @@ def part2() -> int:
     return 0
 
 
+def solve(text: str) -> tuple[int, int]:
+    with aoc.utils.data.input_text(25, text):
+        return part1(), part2()
+
+
 def main() -> None:
     lines = ['25:']
     p1 = part1()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import math
+import random
+import string
+
+# characters puzzle inputs use for labels, like day08's antenna frequencies
+labels = string.digits + string.ascii_letters
+
+
+def scaled_side(side: int, scale: int, odd: bool = False) -> int:
+    # grids grow in both directions so scale the side by sqrt(scale), the number of cells then grows with scale
+    scaled = max(round(side * math.sqrt(scale)), 3)
+    if odd and scaled % 2 == 0:
+        scaled += 1
+    return scaled
+
+
+def grid_to_text(grid: list[list[str]]) -> str:
+    return ''.join(''.join(row) + '\n' for row in grid)
+
+
+def lines_to_text(lines: list[str]) -> str:
+    return ''.join(line + '\n' for line in lines)
+
+
+def walled_grid(width: int, height: int, fill: str = '.') -> list[list[str]]:
+    grid = []
+    for y in range(height):
+        if y in (0, height - 1):
+            grid.append(['#'] * width)
+        else:
+            grid.append(['#'] + [fill] * (width - 2) + ['#'])
+    return grid
+
+
+def maze(rng: random.Random, side: int, loops: float = 0.0) -> list[list[str]]:
+    # a maze on an odd sided grid, paths on the odd coordinates, carved by a depth first walk
+    # so there is exactly one route between any two cells, loops knocks out that fraction of
+    # the remaining internal walls to give alternative routes
+    grid = walled_grid(side, side, '#')
+    start = (1, side - 2)
+    grid[start[1]][start[0]] = '.'
+    stack = [start]
+    while stack:
+        x, y = stack[-1]
+        options = []
+        for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2)):
+            nx, ny = x + dx, y + dy
+            if 0 < nx < side - 1 and 0 < ny < side - 1 and grid[ny][nx] == '#':
+                options.append((nx, ny))
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        grid[(y + ny) // 2][(x + nx) // 2] = '.'
+        grid[ny][nx] = '.'
+        stack.append((nx, ny))
+
+    if loops:
+        for y in range(1, side - 1):
+            for x in range(1, side - 1):
+                # walls between two path cells
+                if grid[y][x] == '#' and (x + y) % 2 == 1 and rng.random() < loops:
+                    grid[y][x] = '.'
+    return grid
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import random
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    count = 1000 * scale
+    left = [rng.randint(10000, 99999) for _ in range(count)]
+    # some of the right list repeats the left so part 2 has similarities to count
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999) for _ in range(count)]
+    return ''.join(f'{a}   {b}\n' for a, b in zip(left, right))
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import random
+
+
+def report(rng: random.Random) -> list[int]:
+    direction = rng.choice((-1, 1))
+    levels = [rng.randint(10, 90)]
+    for _ in range(rng.randint(4, 7)):
+        levels.append(levels[-1] + direction * rng.randint(1, 3))
+    # about half the reports get a bad level, some of those can be fixed by the dampener
+    if rng.random() < 0.5:
+        levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+    return levels
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    return ''.join(' '.join(map(str, report(rng))) + '\n' for _ in range(1000 * scale))
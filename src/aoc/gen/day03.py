@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import random
+
+noise = "mul()do,n't[]{}<>!@#$%^&*?;:-+ 0123456789who select from when"
+
+
+def token(rng: random.Random) -> str:
+    r = rng.random()
+    if r < 0.25:
+        return f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+    if r < 0.28:
+        return "don't()"
+    if r < 0.31:
+        return 'do()'
+    return ''.join(rng.choice(noise) for _ in range(rng.randint(1, 8)))
+
+
+def line(rng: random.Random) -> str:
+    tokens = []
+    length = 0
+    while length < 3000:
+        tokens.append(token(rng))
+        length += len(tokens[-1])
+    return ''.join(tokens)
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    return ''.join(line(rng) + '\n' for _ in range(6 * scale))
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(140, scale)
+    grid = [[rng.choice('XMAS') for _ in range(side)] for _ in range(side)]
+    return aoc.gen.common.grid_to_text(grid)
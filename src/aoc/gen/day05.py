@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import random
+
+
+def update(rng: random.Random, order: list[int]) -> list[int]:
+    pages = rng.sample(order, rng.randrange(5, 24, 2))
+    # half in the right order, the rest for part 2 to fix
+    if rng.random() < 0.5:
+        pages.sort(key=order.index)
+    return pages
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    order = rng.sample(range(10, 100), 49)
+    rules = [f'{a}|{b}' for i, a in enumerate(order) for b in order[i + 1 :]]
+    rng.shuffle(rules)
+    updates = [','.join(map(str, update(rng, order))) for _ in range(200 * scale)]
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates) + '\n'
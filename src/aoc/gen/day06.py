@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def escapes(grid: list[list[str]], x: int, y: int) -> bool:
+    # walk the guard to check the map has no loop, part 1 would never finish
+    side = len(grid)
+    dx, dy = 0, -1
+    seen = set()
+    while True:
+        if (x, y, dx, dy) in seen:
+            return False
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < side and 0 <= ny < side):
+            return True
+        if grid[ny][nx] == '#':
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(130, scale)
+    while True:
+        grid = [['#' if rng.random() < 0.05 else '.' for _ in range(side)] for _ in range(side)]
+        x = rng.randrange(side // 4, 3 * side // 4)
+        y = rng.randrange(side // 4, 3 * side // 4)
+        grid[y][x] = '^'
+        if escapes(grid, x, y):
+            return aoc.gen.common.grid_to_text(grid)
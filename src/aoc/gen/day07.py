@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import random
+
+
+def equation(rng: random.Random) -> str:
+    numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+    # half solvable with some mix of the operators, the rest probably not
+    if rng.random() < 0.5:
+        total = numbers[0]
+        for n in numbers[1:]:
+            op = rng.choice('+*|')
+            if op == '+':
+                total += n
+            elif op == '*':
+                total *= n
+            else:
+                total = int(f'{total}{n}')
+    else:
+        total = rng.randint(1, 10 ** rng.randint(3, 15))
+    return f'{total}: ' + ' '.join(map(str, numbers))
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    return ''.join(equation(rng) + '\n' for _ in range(850 * scale))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(50, scale)
+    grid = [['.'] * side for _ in range(side)]
+    cells = rng.sample(range(side * side), side * side // 12)
+    for cell in cells:
+        grid[cell // side][cell % side] = rng.choice(aoc.gen.common.labels)
+    return aoc.gen.common.grid_to_text(grid)
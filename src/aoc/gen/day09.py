@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import random
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    digits = []
+    for _ in range(10000 * scale):
+        digits.append(str(rng.randint(1, 9)))
+        digits.append(str(rng.randint(0, 9)))
+    # the map ends with a file
+    return ''.join(digits[:-1]) + '\n'
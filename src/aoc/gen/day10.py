@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import collections
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(50, scale)
+    # hills around random summits, each cell 9 less its distance to the nearest one, so every 0 has
+    # trails up to a 9 and neighbours differ by at most one. past 9 steps the heights wrap round to
+    # more hills. the number of summits, trailheads and trails grows with the area
+    distance = [[-1] * side for _ in range(side)]
+    queue = collections.deque()
+    for _ in range(side * side // 60):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if distance[y][x] < 0:
+            distance[y][x] = 0
+            queue.append((x, y))
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < side and 0 <= ny < side and distance[ny][nx] < 0:
+                distance[ny][nx] = distance[y][x] + 1
+                queue.append((nx, ny))
+    grid = [[9 - d % 10 for d in row] for row in distance]
+    # a few rocks break some trails, like the puzzle's uneven ground
+    for _ in range(side * side // 20):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.randint(0, 9)
+    return ''.join(''.join(map(str, row)) + '\n' for row in grid)
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import random
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    stones = [rng.randint(0, 999999) for _ in range(8 * scale)]
+    return ' '.join(map(str, stones)) + '\n'
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import collections
+import random
+import string
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(140, scale)
+    grid = [[''] * side for _ in range(side)]
+    # grow regions out from random seeds, breadth first so every cell is claimed once
+    queue = collections.deque()
+    for _ in range(side * side // 60):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if not grid[y][x]:
+            grid[y][x] = rng.choice(string.ascii_uppercase)
+            queue.append((x, y))
+    while queue:
+        # take from either end so the regions get ragged edges
+        x, y = queue.popleft() if rng.random() < 0.7 else queue.pop()
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < side and 0 <= ny < side and not grid[ny][nx]:
+                grid[ny][nx] = grid[y][x]
+                queue.append((nx, ny))
+    return aoc.gen.common.grid_to_text(grid)
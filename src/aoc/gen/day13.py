@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import random
+
+
+def machine(rng: random.Random) -> str:
+    while True:
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        # parallel buttons have no single solution
+        if ax * by != ay * bx:
+            break
+    # about a third can be won
+    if rng.random() < 0.35:
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+    else:
+        px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+    return f'Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n'
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    return '\n'.join(machine(rng) for _ in range(320 * scale))
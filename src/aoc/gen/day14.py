@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import random
+
+# the solver's room size, more robots than cells would mean part 2 never finds a tick without overlaps
+width = 101
+height = 103
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    count = min(500 * scale, width * height // 2)
+    # pick where the robots are on a tick where none overlap and run them back from there
+    tick = rng.randint(1000, width * height - 1)
+    cells = rng.sample(range(width * height), count)
+    lines = []
+    for cell in cells:
+        vx = rng.choice([v for v in range(-99, 100) if v])
+        vy = rng.choice([v for v in range(-99, 100) if v])
+        px = (cell % width - vx * tick) % width
+        py = (cell // width - vy * tick) % height
+        lines.append(f'p={px},{py} v={vx},{vy}\n')
+    return ''.join(lines)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(50, scale)
+    grid = aoc.gen.common.walled_grid(side, side)
+    for y in range(1, side - 1):
+        for x in range(1, side - 1):
+            r = rng.random()
+            if r < 0.08:
+                grid[y][x] = '#'
+            elif r < 0.4:
+                grid[y][x] = 'O'
+    grid[side // 2][side // 2] = '@'
+    moves = ''.join(rng.choice('<>^v') for _ in range(20000 * scale))
+    lines = [moves[i : i + 1000] for i in range(0, len(moves), 1000)]
+    return aoc.gen.common.grid_to_text(grid) + '\n' + aoc.gen.common.lines_to_text(lines)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = aoc.gen.common.scaled_side(141, scale, odd=True)
+    grid = aoc.gen.common.maze(rng, side, loops=0.1)
+    grid[side - 2][1] = 'S'
+    grid[1][side - 2] = 'E'
+    return aoc.gen.common.grid_to_text(grid)
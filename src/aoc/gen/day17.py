@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import random
+
+
+def output(a: int, b1: int, b2: int) -> int:
+    # the digit the program outputs before it shifts A
+    b = (a & 7) ^ b1
+    return (b ^ b2 ^ (a >> b)) & 7
+
+
+def has_quine(program: list[int], b1: int, b2: int) -> bool:
+    # part 2's search, three bits of A for each digit from the last. most programs have no A that outputs them
+    candidates = [0]
+    for digit in reversed(program):
+        candidates = [a << 3 | n for a in candidates for n in range(8) if (a << 3 | n) and output(a << 3 | n, b1, b2) == digit]
+    return bool(candidates)
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    # the program has the same shape as the puzzle's, output one digit per three bits of A and loop.
+    # only programs that can output themselves are kept, so part 2 has an answer. part 2's search
+    # depends on the program's length, not A, so only part 1 grows with scale, A is longer and the program loops longer
+    while True:
+        b1, b2 = rng.randint(1, 7), rng.randint(1, 7)
+        program = [2, 4, 1, b1, 7, 5, 1, b2, 4, rng.randint(0, 7), 0, 3, 5, 5, 3, 0]
+        if has_quine(program, b1, b2):
+            break
+    a = rng.getrandbits(48 * scale) | 1 << (48 * scale - 1)
+    return f'Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {",".join(map(str, program))}\n'
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    # the solver sizes the memory space from the largest coordinate, list most of it
+    # so the exit gets cut off
+    size = aoc.gen.common.scaled_side(71, scale)
+    cells = [(x, y) for y in range(size) for x in range(size) if (x, y) not in ((0, 0), (size - 1, size - 1))]
+    rng.shuffle(cells)
+    cells = cells[: len(cells) * 2 // 3]
+    # make sure the largest coordinate appears
+    cells.append((size - 1, rng.randrange(size - 1)))
+    return ''.join(f'{x},{y}\n' for x, y in cells)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import random
+
+colours = 'wubrg'
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    patterns = set()
+    while len(patterns) < 447:
+        patterns.add(''.join(rng.choice(colours) for _ in range(rng.randint(1, 8))))
+    towels = sorted(patterns)
+    designs = []
+    for _ in range(400 * scale):
+        design = ''
+        while len(design) < rng.randint(40, 60):
+            # mostly built from towels, a stray stripe makes some impossible
+            design += rng.choice(towels) if rng.random() < 0.98 else rng.choice(colours)
+        designs.append(design)
+    return ', '.join(towels) + '\n\n' + ''.join(d + '\n' for d in designs)
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import random
+
+import aoc.gen.common
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    # a maze without loops has one route from start to end like the puzzle's race track,
+    # the dead ends off it are never visited
+    side = aoc.gen.common.scaled_side(141, scale, odd=True)
+    grid = aoc.gen.common.maze(rng, side)
+    grid[side - 2][1] = 'S'
+    grid[1][side - 2] = 'E'
+    return aoc.gen.common.grid_to_text(grid)
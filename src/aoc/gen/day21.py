@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import random
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    # the keypad layouts are read from numeric.txt and directional.txt alongside
+    return ''.join('%03dA\n' % rng.randint(1, 999) for _ in range(5 * scale))
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+import random
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    return ''.join(f'{rng.randint(1, 16777215)}\n' for _ in range(2000 * scale))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+
+
+def names(rng: random.Random, count: int) -> list[str]:
+    # two letter names like the puzzle while they last
+    length = 2 if count <= 26 * 26 else 3
+    every = [''.join(n) for n in itertools.product(string.ascii_lowercase, repeat=length)]
+    return sorted(rng.sample(every, count))
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    nodes = names(rng, min(520 * scale, 26**3))
+    edges = set()
+    for node in nodes:
+        for other in rng.sample(nodes, 6):
+            if other != node:
+                edges.add(tuple(sorted((node, other))))
+    # plant a LAN party for part 2 to find
+    party = rng.sample(nodes, 13)
+    for a, b in itertools.combinations(party, 2):
+        edges.add(tuple(sorted((a, b))))
+    # sorted first, a set of strings is in a different order in each process
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return ''.join(f'{a}-{b}\n' for a, b in edges)
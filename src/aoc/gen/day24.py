@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+
+
+def wire_names(rng: random.Random, count: int) -> list[str]:
+    # no x, y or z, those are the inputs and outputs
+    letters = string.ascii_lowercase[:23]
+    every = [''.join(n) for n in itertools.product(letters, repeat=3)]
+    return rng.sample(every, count)
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    # a ripple carry adder like the puzzle's, with the outputs of two gates swapped in four of the bits
+    bits = 45 * scale
+    names = iter(wire_names(rng, 4 * bits))
+    adders = []
+    carry = next(names)
+    adders.append([['x00', 'XOR', 'y00', 'z00'], ['x00', 'AND', 'y00', carry]])
+    for i in range(1, bits):
+        x, y, z = f'x{i:02}', f'y{i:02}', f'z{i:02}'
+        half, both, through = next(names), next(names), next(names)
+        gates = [[x, 'XOR', y, half], [x, 'AND', y, both], [half, 'XOR', carry, z], [half, 'AND', carry, through]]
+        carry = f'z{bits:02}' if i == bits - 1 else next(names)
+        gates.append([through, 'OR', both, carry])
+        adders.append(gates)
+
+    for i in rng.sample(range(1, bits - 1), 4):
+        a, b = rng.sample(adders[i], 2)
+        a[3], b[3] = b[3], a[3]
+    gates = [g for adder in adders for g in adder]
+    rng.shuffle(gates)
+
+    lines = [f'x{i:02}: {rng.randint(0, 1)}' for i in range(bits)]
+    lines += [f'y{i:02}: {rng.randint(0, 1)}' for i in range(bits)]
+    lines.append('')
+    lines += [f'{a} {op} {b} -> {out}' for a, op, b, out in gates]
+    return ''.join(line + '\n' for line in lines)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import random
+
+
+def schematic(rng: random.Random, lock: bool) -> str:
+    heights = [rng.randint(0, 5) for _ in range(5)]
+    rows = []
+    for row in range(7):
+        # locks fill down from the top row, keys up from the bottom
+        level = row if lock else 6 - row
+        rows.append(''.join('#' if level <= h else '.' for h in heights))
+    return '\n'.join(rows) + '\n'
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    schematics = [schematic(rng, True) for _ in range(250 * scale)]
+    schematics += [schematic(rng, False) for _ in range(250 * scale)]
+    rng.shuffle(schematics)
+    return '\n'.join(schematics)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import importlib
+import pathlib
+import random
+import types
+
+import aoc.utils.days
+import aoc.utils.memory
+import aoc.utils.paths
+
+default_seed = 2024
+
+
+def generator_module(day: int) -> types.ModuleType:
+    return importlib.import_module('aoc.gen.day%02d' % day)
+
+
+def generate(day: int, scale: int, seed: int = default_seed) -> str:
+    # seeded by day and scale as well so each file is reproducible on its own
+    rng = random.Random(f'{seed}:{day}:{scale}')
+    return generator_module(day).generate(rng, scale)
+
+
+def write(day: int, scale: int, seed: int = default_seed) -> pathlib.Path:
+    path = aoc.utils.paths.day_scale_path(day, scale)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate(day, scale, seed=seed))
+    return path
+
+
+def ensure(day: int, scale: int, seed: int = default_seed) -> pathlib.Path:
+    path = aoc.utils.paths.day_scale_path(day, scale)
+    if path.exists():
+        return path
+    return write(day, scale, seed=seed)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate scaled inputs as data/dayNN/scaleK.txt')
+    parser.add_argument('days', nargs='*', type=int, help='days to generate (default: all available)')
+    parser.add_argument('-s', '--scale', type=int, action='append', help='scale factor, about K times the size of a puzzle input (default: 1)')
+    parser.add_argument('--seed', type=int, default=default_seed, help=f'random seed (default: {default_seed})')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    days = args.days or aoc.utils.days.available_days()
+    for day in days:
+        for scale in args.scale or [1]:
+            path = write(day, scale, seed=args.seed)
+            print(f'{path}: {aoc.utils.memory.format_bytes(path.stat().st_size)}')
+
+
+if __name__ == '__main__':
+    main()
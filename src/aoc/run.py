@@ -1,30 +1,302 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
-import datetime
-import importlib
+import argparse
+import concurrent
+import pathlib
+import sys
+from typing import Iterator
 
+import aoc.utils.answers
+import aoc.utils.cache
+import aoc.utils.data
+import aoc.utils.days
+import aoc.utils.instrument
+import aoc.utils.lazy
+import aoc.utils.memory
+import aoc.utils.paths
 
-def run_day(day: int) -> None:
-    module_name = 'aoc.days.day%02d.run' % day
-    mod = importlib.import_module(module_name)
-    mod.main()
+# only some options need these, so they're loaded when first used rather than on every run
+for name in ('concurrent.futures', 'aoc.bench', 'aoc.utils.forkserver', 'aoc.utils.importtime', 'aoc.utils.profiling', 'aoc.utils.scheduler'):
+    aoc.utils.lazy.lazy_import(name)
+
+DayResults = tuple[int, list[aoc.utils.days.PartResult]]
+
+
+def run_day(day: int, memory: bool = False) -> list[aoc.utils.days.PartResult]:
+    return aoc.utils.days.solve_day(day, memory=memory)
+
+
+def result_details(result: aoc.utils.days.PartResult, times: bool) -> str:
+    details = []
+    if times and not result.cached and not result.timed_out:
+        details.append(f'{result.elapsed:.3f}s')
+    if result.memory:
+        details.append(f'peak {aoc.utils.memory.format_bytes(result.memory["peak"])}')
+        details.append(f'process peak rss {aoc.utils.memory.format_bytes(result.memory["process_rss"])}')
+    if not details:
+        return ''
+    return ' [' + ', '.join(details) + ']'
+
+
+def print_day(day: int, results: list[aoc.utils.days.PartResult], times: bool = False, cache_stats: bool = False) -> None:
+    lines = ['day%02d:' % day]
+    for r in results:
+        lines.append(str(r) + result_details(r, times))
+        if r.memory:
+            for site in r.memory['sites']:
+                lines.append(f'    {site}')
+        if cache_stats and r.cache_stats:
+            for stats in r.cache_stats:
+                lines.append(f'    {aoc.utils.cache.format_stats(stats)}')
+    print('\n  '.join(lines))
+    if any(r.regions for r in results):
+        print_regions(results)
+    if not all(r.ok() for r in results):
+        print(f'Failed on day {day}')
+
+
+def print_regions(results: list[aoc.utils.days.PartResult]) -> None:
+    rows = [('region', 'part', 'calls', 'total', 'per call')]
+    for r in results:
+        for region in r.regions or []:
+            per_call = region['seconds'] / region['calls']
+            rows.append(
+                (
+                    region['name'],
+                    str(r.part),
+                    str(region['calls']),
+                    aoc.bench.format_seconds(region['seconds']),
+                    aoc.bench.format_seconds(per_call),
+                )
+            )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        cells = [row[0].ljust(widths[0])] + [c.rjust(w) for c, w in zip(row[1:], widths[1:])]
+        print('  ' + '  '.join(cells))
+
+
+def failed_results(day: int, error: Exception) -> list[aoc.utils.days.PartResult]:
+    return [aoc.utils.days.PartResult(day, part, error=aoc.utils.days.describe_error(error)) for part in aoc.utils.days.parts]
+
+
+def cached_results(day: int, answers: dict[int, int | str]) -> list[aoc.utils.days.PartResult]:
+    return [aoc.utils.days.PartResult(day, part, answer=answers[part], cached=True) for part in aoc.utils.days.parts]
+
+
+def run_sequential(days: list[int], memory: bool) -> Iterator[DayResults]:
+    for day in days:
+        yield day, run_day(day, memory=memory)
+
+
+def run_parallel_days(days: list[int], jobs: int, memory: bool) -> Iterator[DayResults]:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {day: pool.submit(run_day, day, memory=memory) for day in days}
+        # yield in day order as each day completes
+        for day in days:
+            try:
+                results = futures[day].result()
+            except Exception as e:
+                results = failed_results(day, e)
+            yield day, results
+
+
+def run_parallel_parts(days: list[int], jobs: int, memory: bool) -> Iterator[DayResults]:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for day in days:
+            for part in aoc.utils.days.parts:
+                futures[(day, part)] = pool.submit(aoc.utils.days.solve_part, day, part, memory=memory)
+        for day in days:
+            results = []
+            for part in aoc.utils.days.parts:
+                try:
+                    results.append(futures[(day, part)].result())
+                except Exception as e:
+                    results.append(aoc.utils.days.PartResult(day, part, error=aoc.utils.days.describe_error(e)))
+            yield day, results
+
+
+def run_budgeted(days: list[int], jobs: int, budget: aoc.utils.scheduler.Budget, memory: bool) -> Iterator[DayResults]:
+    tasks = [(day, part) for day in days for part in aoc.utils.days.parts]
+    finished = {}
+    remaining = list(days)
+    for result in aoc.utils.scheduler.run(tasks, jobs, budget, memory=memory):
+        finished[(result.day, result.part)] = result
+        # yield in day order as soon as all of a day's parts are done
+        while remaining and all((remaining[0], part) in finished for part in aoc.utils.days.parts):
+            day = remaining.pop(0)
+            yield day, [finished.pop((day, part)) for part in aoc.utils.days.parts]
+
+
+def run_forked(days: list[int], jobs: int, per_part: bool, budget: aoc.utils.scheduler.Budget | None, memory: bool) -> Iterator[DayResults]:
+    failed = aoc.utils.forkserver.preload(days)
+    if per_part:
+        tasks = [(day, [part]) for day in days if day not in failed for part in aoc.utils.days.parts]
+    else:
+        tasks = [(day, list(aoc.utils.days.parts)) for day in days if day not in failed]
+    finished = {}
+    for day, e in failed.items():
+        for result in failed_results(day, e):
+            finished[(day, result.part)] = result
+    remaining = list(days)
+    for result in aoc.utils.forkserver.run(tasks, jobs, budget, memory=memory):
+        finished[(result.day, result.part)] = result
+        # yield in day order as soon as all of a day's parts are done
+        while remaining and all((remaining[0], part) in finished for part in aoc.utils.days.parts):
+            day = remaining.pop(0)
+            yield day, [finished.pop((day, part)) for part in aoc.utils.days.parts]
+    # days that failed to load at the end of the list
+    for day in remaining:
+        yield day, [finished.pop((day, part)) for part in aoc.utils.days.parts]
+
+
+def parse_budgets(default: float | None, overrides: list[str]) -> aoc.utils.scheduler.Budget:
+    # DAY[:PART]=SECONDS
+    budgets = {}
+    for o in overrides:
+        spec, _, seconds = o.partition('=')
+        budgets[aoc.utils.days.parse_day_part(spec)] = float(seconds)
+
+    def budget(day: int, part: int) -> float | None:
+        if (day, part) in budgets:
+            return budgets[(day, part)]
+        return budgets.get((day, None), default)
+
+    return budget
+
+
+def run_days(days: list[int], args: argparse.Namespace) -> Iterator[DayResults]:
+    if args.fork:
+        budget = parse_budgets(args.timeout, args.day_timeout) if args.timeout or args.day_timeout else None
+        return run_forked(days, args.jobs, args.parts, budget, args.memory)
+    if args.timeout or args.day_timeout:
+        return run_budgeted(days, args.jobs, parse_budgets(args.timeout, args.day_timeout), args.memory)
+    if args.jobs > 1 and args.parts:
+        return run_parallel_parts(days, args.jobs, args.memory)
+    if args.jobs > 1:
+        return run_parallel_days(days, args.jobs, args.memory)
+    return run_sequential(days, args.memory)
+
+
+def verify_results(day: int, results: list[aoc.utils.days.PartResult], answers: dict[int, int | str]) -> bool:
+    ok = True
+    for r in results:
+        if r.ok() and r.answer != answers[r.part]:
+            print('day%02d/part%d: %s does not match cached answer %s' % (day, r.part, r.answer, answers[r.part]))
+            ok = False
+    return ok
+
+
+def run_cached(days: list[int], args: argparse.Namespace) -> bool:
+    # answers from the on-disk cache, skip days whose input and source haven't changed.
+    # False if a part failed or timed out, or didn't match its cached answer on a verify run
+    use_cache = not args.no_cache
+    times = args.times or args.memory
+    cached = {}
+    # measuring memory means running everything
+    if (use_cache or args.verify) and not args.memory:
+        for day in days:
+            answers = aoc.utils.answers.load(day)
+            if answers:
+                cached[day] = answers
+
+    to_run = [day for day in days if args.verify or day not in cached]
+    ran = run_days(to_run, args)
+    ok = True
+    for day in days:
+        if day not in to_run:
+            print_day(day, cached_results(day, cached[day]), times=times)
+            continue
+
+        _, results = next(ran)
+        print_day(day, results, times=times, cache_stats=args.cache_stats)
+        solved = all(r.ok() for r in results)
+        ok = solved and ok
+        if day in cached:
+            # a verify run only checks, the cached answers stay the reference even when they don't match
+            ok = verify_results(day, results, cached[day]) and ok
+        elif use_cache and solved:
+            aoc.utils.answers.store(day, {r.part: r.answer for r in results})
+    return ok
+
+
+def run_profile(spec: str, output_dir: pathlib.Path, top: int) -> bool:
+    day, part = aoc.utils.days.parse_day_part(spec)
+    parts = [part] if part else aoc.utils.days.parts
+    results = []
+    for p in parts:
+        results.append(aoc.utils.profiling.profile_part(day, p, output_dir, top=top))
+    print_day(day, results)
+    return all(r.ok() for r in results)
+
+
+def run_sample(spec: str, output_dir: pathlib.Path, interval: float, top: int) -> bool:
+    day, part = aoc.utils.days.parse_day_part(spec)
+    parts = [part] if part else aoc.utils.days.parts
+    results = []
+    for p in parts:
+        results.append(aoc.utils.profiling.sample_part(day, p, output_dir, interval=interval, top=top))
+    print_day(day, results, times=True)
+    return all(r.ok() for r in results)
+
+
+def run_import_time(days: list[int], top: int) -> None:
+    modules = ['aoc.run'] + [aoc.utils.days.day_module_name(day) for day in days]
+    aoc.utils.importtime.print_report(aoc.utils.importtime.measure(modules), top=top)
+    bare, loaded = aoc.utils.importtime.startup(modules)
+    print(f'\ninterpreter startup {aoc.bench.format_seconds(bare)}, importing the runner and days {aoc.bench.format_seconds(loaded)}')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Advent of code 2024')
+    parser.add_argument('days', nargs='*', type=int, help='days to run (default: all available)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes (default: 1, run in this process)')
+    parser.add_argument('--parts', action='store_true', help='with --jobs or --fork, send each part to the pool rather than each day')
+    parser.add_argument('--fork', action='store_true', help='load every day and its input once, then fork a child process for each day (or part)')
+    parser.add_argument('--timeout', type=float, help='wall clock budget in seconds for each part, a part that overruns is killed')
+    parser.add_argument('--day-timeout', metavar='DAY[:PART]=SECONDS', action='append', default=[], help='budget for a day or part, overrides --timeout')
+    parser.add_argument('--input', metavar='FILENAME', help='read data/dayNN/FILENAME instead of input.txt, e.g. scale4.txt from bin/gen.sh')
+    parser.add_argument('--no-cache', action='store_true', help="don't read or write the answer or parsed input caches in data/.cache")
+    parser.add_argument('--verify', action='store_true', help='run days with cached answers and check they still match')
+    parser.add_argument('--times', action='store_true', help='print how long each part took')
+    parser.add_argument('--memory', action='store_true', help='trace memory, print the peak, RSS and top allocation sites for each part')
+    parser.add_argument('--cache-stats', action='store_true', help='print hits, misses and evictions for each memoized function a part used')
+    parser.add_argument('--instrument', action='store_true', help='count calls and time in the instrumented regions and print a table for each day')
+    parser.add_argument('--profile', metavar='DAY[:PART]', help='run a single day, or part, under cProfile')
+    parser.add_argument('--sample', metavar='DAY[:PART]', help='run a single day, or part, under the sampling profiler and write collapsed stacks')
+    parser.add_argument('--sample-interval', type=float, default=0.001, help='seconds of CPU time between samples (default: 0.001)')
+    parser.add_argument('--profile-dir', type=pathlib.Path, default=pathlib.Path('.'), help='where to write the .prof and .folded files (default: .)')
+    parser.add_argument('--profile-top', type=int, default=25, help='number of functions, or modules, to report (default: 25)')
+    parser.add_argument('--import-time', action='store_true', help='report how long importing the runner and the days takes, from python -X importtime')
+    return parser.parse_args()
 
 
 def main() -> None:
+    args = parse_args()
+    if args.instrument:
+        # before any of the days are imported
+        aoc.utils.instrument.enable()
     print('Advent of code 2024')
-    today = datetime.date.today()
-    xmas = datetime.date(2024, 12, 25)
-    end = 25
-    if today < xmas:
-        end = today.day
-
-    for day in range(1, end + 1):
-        try:
-            run_day(day)
-        except:
-            print(f'Failed on day {day}')
-            break
+    if args.input:
+        aoc.utils.paths.set_input_filename(args.input)
+    if args.no_cache:
+        aoc.utils.data.disable_persist()
+    if args.profile:
+        if not run_profile(args.profile, args.profile_dir, args.profile_top):
+            sys.exit(1)
+        return
+    if args.sample:
+        if not run_sample(args.sample, args.profile_dir, args.sample_interval, args.profile_top):
+            sys.exit(1)
+        return
+    if args.import_time:
+        run_import_time(args.days or aoc.utils.days.available_days(), args.profile_top)
+        return
+
+    days = args.days or aoc.utils.days.available_days()
+    if not run_cached(days, args):
+        sys.exit(1)
 
 
 if __name__ == '__main__':
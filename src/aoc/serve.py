@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import concurrent.futures.process
+import contextlib
+import json
+import multiprocessing
+import os
+import pathlib
+import sys
+import time
+
+import aoc.utils.days
+
+# JSON lines both ways, one request per line:
+#   {"day": 1, "input": "3   4\n4   3\n...", "id": "optional, echoed back"}
+# and the reply:
+#   {"day": 1, "part1": 11, "part2": 31, "elapsed": 0.0001, "total": 0.0004, "id": ...}
+# elapsed is the time solving in the worker, total is from reading the request to replying.
+# a request that can't be solved, crashes its worker or runs out of time gets {"error": "..."} instead of the answers
+
+default_socket = pathlib.Path('aoc.sock')
+
+
+def warm_all(days: list[int]) -> list[int]:
+    # import and set up every day before the workers are forked, so they start warm
+    loaded = []
+    for day in days:
+        try:
+            aoc.utils.days.setup_day(aoc.utils.days.day_module(day))
+        except Exception as e:
+            print(f'day{day:02}: not loaded ({aoc.utils.days.describe_error(e)})', file=sys.stderr)
+            continue
+        loaded.append(day)
+    return loaded
+
+
+def solve(day: int, text: str) -> dict:
+    start = time.perf_counter()
+    try:
+        part1, part2 = aoc.utils.days.day_module(day).solve(text)
+        reply = {'day': day, 'part1': part1, 'part2': part2}
+    except Exception as e:
+        reply = {'day': day, 'error': aoc.utils.days.describe_error(e)}
+    reply['elapsed'] = time.perf_counter() - start
+    return reply
+
+
+def make_pool(jobs: int, days: list[int]) -> concurrent.futures.ProcessPoolExecutor:
+    # forked after the parent has warmed the days, so the workers start warm
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    return concurrent.futures.ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=warm_all, initargs=(days,))
+
+
+class Server:
+    def __init__(self, jobs: int, days: list[int], timeout: float | None) -> None:
+        self.jobs = jobs
+        self.days = days
+        self.timeout = timeout
+        self.pool = make_pool(jobs, days)
+
+    def replace_pool(self, pool: concurrent.futures.ProcessPoolExecutor, kill: bool = False) -> None:
+        # the other requests that fail along with this one find the pool already replaced
+        if pool is not self.pool:
+            return
+        if kill:
+            # a worker still running a timed out solve can't be cancelled, so the old pool's workers are
+            # killed. they're the server's only child processes, and the new pool isn't started yet
+            for process in multiprocessing.active_children():
+                process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.pool = make_pool(self.jobs, self.days)
+
+    async def handle_request(self, line: bytes) -> dict:
+        start = time.perf_counter()
+        try:
+            request = json.loads(line)
+            day = int(request['day'])
+            text = request['input']
+        except (ValueError, KeyError, TypeError) as e:
+            return {'error': f'bad request: {aoc.utils.days.describe_error(e)}'}
+
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        try:
+            reply = await asyncio.wait_for(loop.run_in_executor(pool, solve, day, text), self.timeout)
+        except asyncio.TimeoutError:
+            reply = {'day': day, 'error': f'timed out after {self.timeout}s'}
+            self.replace_pool(pool, kill=True)
+        except concurrent.futures.process.BrokenProcessPool:
+            reply = {'day': day, 'error': 'worker died, the pool has been restarted'}
+            self.replace_pool(pool)
+        if 'id' in request:
+            reply['id'] = request['id']
+        reply['total'] = time.perf_counter() - start
+        return reply
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # requests on one connection are answered in order, use more connections for more at once
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                reply = await self.handle_request(line)
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args: argparse.Namespace, days: list[int]) -> None:
+    days = warm_all(days)
+    server = Server(args.jobs, days, args.timeout)
+    try:
+        # start the workers now rather than on the first request
+        await asyncio.get_running_loop().run_in_executor(server.pool, warm_all, [])
+        if args.port:
+            listener = await asyncio.start_server(server.handle_connection, args.host, args.port, limit=args.limit)
+            where = f'{args.host}:{args.port}'
+        else:
+            args.socket.unlink(missing_ok=True)
+            listener = await asyncio.start_unix_server(server.handle_connection, args.socket, limit=args.limit)
+            where = str(args.socket)
+        print(f'serving {len(days)} days on {where} with {args.jobs} workers', flush=True)
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.pool.shutdown(cancel_futures=True)
+
+
+async def query(args: argparse.Namespace, day: int, path: pathlib.Path) -> dict:
+    if args.port:
+        reader, writer = await asyncio.open_connection(args.host, args.port, limit=args.limit)
+    else:
+        reader, writer = await asyncio.open_unix_connection(args.socket, limit=args.limit)
+    writer.write(json.dumps({'day': day, 'input': path.read_text()}).encode() + b'\n')
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return reply
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Serve answers for (day, input) requests from warm worker processes')
+    parser.add_argument('days', nargs='*', type=int, help='days to load (default: all available)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='number of worker processes (default: one per CPU)')
+    parser.add_argument('-s', '--socket', type=pathlib.Path, default=default_socket, help=f'unix socket to listen on (default: {default_socket})')
+    parser.add_argument('--host', default='127.0.0.1', help='with --port, address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, help='listen on TCP rather than the unix socket')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds a request may take before its worker is killed (default: 600)')
+    parser.add_argument('--limit', type=int, default=64 * 1024 * 1024, help='longest request line in bytes (default: 64MiB)')
+    parser.add_argument('--query', nargs=2, metavar=('DAY', 'FILE'), help='send one request to a running server and print the reply')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.query:
+        day, path = args.query
+        reply = asyncio.run(query(args, int(day), pathlib.Path(path)))
+        print(json.dumps(reply))
+        if 'error' in reply:
+            sys.exit(1)
+        return
+
+    days = args.days or aoc.utils.days.available_days()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args, days))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+
+import aoc.utils.paths
+
+
+def file_digest(path: pathlib.Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def source_digest(day: int) -> str:
+    # the day's own modules and the shared aoc.utils ones, a change to either can change the answers
+    utils_dir = pathlib.Path(__file__).absolute().parent
+    paths = sorted(aoc.utils.paths.day_source_dir(day).glob('*.py')) + sorted(utils_dir.glob('*.py'))
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.parent.name.encode() + b'/' + path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: int) -> str:
+    return file_digest(aoc.utils.paths.day_input_path(day)) + ':' + source_digest(day)
+
+
+def cache_path(day: int) -> pathlib.Path:
+    # one per input file so switching between inputs doesn't evict the others
+    stem = aoc.utils.paths.day_input_path(day).stem
+    return aoc.utils.paths.cache_dir() / 'answers' / ('day%02d-%s.json' % (day, stem))
+
+
+def load(day: int) -> dict[int, int | str] | None:
+    path = cache_path(day)
+    try:
+        key = cache_key(day)
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if cached.get('key') != key:
+        return None
+    return {int(part): answer for part, answer in cached['answers'].items()}
+
+
+def store(day: int, answers: dict[int, int | str]) -> None:
+    path = cache_path(day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cached = {
+        'key': cache_key(day),
+        'answers': {str(part): answer for part, answer in answers.items()},
+    }
+    path.write_text(json.dumps(cached, indent=2) + '\n')
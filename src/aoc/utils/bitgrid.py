@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import aoc.utils.types
+
+
+class BitGrid:
+    # the shape of a grid whose boolean layers are each a single int, bit y * stride + x for cell x, y.
+    # each row has a padding bit after it that's never set, so a cell shifted east off the end of a
+    # row, or west off the start, lands on padding and is masked away. a whole layer moves one step in
+    # a direction with a shift and a mask, so a frontier advances in a few big-int operations
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+        row = (1 << width) - 1
+        mask = 0
+        for y in range(height):
+            mask |= row << (y * self.stride)
+        # every cell on the grid
+        self.mask = mask
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.stride + x
+
+    def xy(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x, y
+
+    def bit(self, x: int, y: int) -> int:
+        return 1 << (y * self.stride + x)
+
+    def bit_of_point(self, point: aoc.utils.types.Point | aoc.utils.types.Position) -> int:
+        return self.bit(point.x, point.y)
+
+    def layer(self, points: Iterable[aoc.utils.types.Point | aoc.utils.types.Position]) -> int:
+        layer = 0
+        for p in points:
+            layer |= 1 << (p.y * self.stride + p.x)
+        return layer
+
+    def layer_of(self, rows: list[bytes], value: int) -> int:
+        # the cells of a grid's rows equal to value, e.g. ord('#') for the walls
+        # each row becomes a string of binary digits, read as one int rather than a bit at a time
+        digits = bytes(0x31 if c == value else 0x30 for c in range(256))
+        layer = 0
+        for y, row in enumerate(rows):
+            if row:
+                layer |= int(row[::-1].translate(digits), 2) << (y * self.stride)
+        return layer
+
+    def north(self, layer: int) -> int:
+        return layer >> self.stride
+
+    def south(self, layer: int) -> int:
+        return (layer << self.stride) & self.mask
+
+    def east(self, layer: int) -> int:
+        return (layer << 1) & self.mask
+
+    def west(self, layer: int) -> int:
+        return (layer >> 1) & self.mask
+
+    def neighbours(self, layer: int) -> int:
+        # the cells one step N, S, E or W of any cell in the layer
+        stride = self.stride
+        return ((layer >> stride) | (layer << stride) | (layer << 1) | (layer >> 1)) & self.mask
+
+    def flood(self, start: int, spaces: int) -> int:
+        # every cell of spaces reachable from start, one step a round
+        reached = start & spaces
+        frontier = reached
+        while frontier:
+            frontier = self.neighbours(frontier) & spaces & ~reached
+            reached |= frontier
+        return reached
+
+    def steps(self, start: int, spaces: int, target: int) -> int | None:
+        # fewest steps through spaces from any start cell to any target cell, a BFS a whole frontier at a time
+        reached = start & spaces
+        frontier = reached
+        steps = 0
+        while frontier:
+            if frontier & target:
+                return steps
+            frontier = self.neighbours(frontier) & spaces & ~reached
+            reached |= frontier
+            steps += 1
+        return None
+
+    def count(self, layer: int) -> int:
+        return layer.bit_count()
+
+    def cells(self, layer: int) -> Iterator[tuple[int, int]]:
+        while layer:
+            low = layer & -layer
+            yield self.xy(low.bit_length() - 1)
+            layer ^= low
+
+    def format(self, layer: int, on: str = '#', off: str = '.') -> str:
+        lines = []
+        for y in range(self.height):
+            row = layer >> (y * self.stride)
+            lines.append(''.join(on if row >> x & 1 else off for x in range(self.width)))
+        return '\n'.join(lines)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import collections
+import functools
+from typing import Any, Callable
+
+# every memoized function in the process, by qualified name, so the runner can report on them
+registry = {}
+
+
+class Memoized:
+    # maxsize None keeps everything, otherwise the least recently used entry is evicted
+    def __init__(self, func: Callable, maxsize: int | None = None) -> None:
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.name = f'{func.__module__}.{func.__qualname__}'
+        registry[self.name] = self
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        try:
+            value = self.cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            if self.maxsize is not None:
+                self.cache.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.func(*args, **kwargs)
+        self.cache[key] = value
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def calls(self) -> int:
+        return self.hits + self.misses
+
+    def hit_rate(self) -> float:
+        calls = self.calls()
+        return self.hits / calls if calls else 0.0
+
+    def stats(self) -> dict:
+        return {
+            'name': self.name,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.cache),
+            'maxsize': self.maxsize,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def cache_clear(self) -> None:
+        self.cache.clear()
+        self.reset_stats()
+
+
+def memoize(maxsize: int | None = None) -> Callable[[Callable], Memoized]:
+    def decorator(func: Callable) -> Memoized:
+        return Memoized(func, maxsize=maxsize)
+
+    return decorator
+
+
+def stats() -> list[dict]:
+    # only the caches that were used since the last reset
+    return [m.stats() for m in registry.values() if m.calls()]
+
+
+def reset_stats() -> None:
+    for m in registry.values():
+        m.reset_stats()
+
+
+def clear() -> None:
+    # empty every cache, for timing a cold run or before solving another input
+    for m in registry.values():
+        m.cache_clear()
+
+
+def format_stats(stats: dict) -> str:
+    calls = stats['hits'] + stats['misses']
+    rate = stats['hits'] / calls * 100 if calls else 0.0
+    size = f'{stats["size"]}/{stats["maxsize"]}' if stats['maxsize'] is not None else str(stats['size'])
+    return f'{stats["name"]}: {stats["hits"]} hits, {stats["misses"]} misses ({rate:.1f}% hit), {stats["evictions"]} evictions, size {size}'
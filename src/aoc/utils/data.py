@@ -1,80 +1,329 @@
 from __future__ import annotations
 
+import contextlib
+import io
+import marshal
+import mmap
+import os
 import pathlib
+import re
+from typing import IO, TYPE_CHECKING, Callable, Iterator, TypeVar
 
+import aoc.utils.answers
+import aoc.utils.cache
+import aoc.utils.grid
+import aoc.utils.lazy
 import aoc.utils.paths
 
+if TYPE_CHECKING:
+    import numpy
+
+# only the parsed cache on disk needs it
+pickle = aoc.utils.lazy.lazy_import('pickle')
+
+T = TypeVar('T')
+
+# parsed inputs keyed by (day, loader, path, mtime, size)
+_parsed = {}
+
+# every integer in some text, whatever separates them
+int_pattern = re.compile(rb'-?\d+')
+
+
+class TextInput:
+    # stands in for a day's input path when the input is given as text, see input_text()
+    def __init__(self, day: int, text: str) -> None:
+        self.name = '<day%02d text>' % day
+        self.text = text
+
+    def open(self, mode: str = 'r') -> IO:
+        if 'b' in mode:
+            return io.BytesIO(self.read_bytes())
+        return io.StringIO(self.text)
+
+    def read_bytes(self) -> bytes:
+        return self.text.encode()
+
+
+# day -> TextInput, while input_text() is active
+_texts = {}
+
+
+@contextlib.contextmanager
+def input_text(day: int, text: str) -> Iterator[None]:
+    # the day's input functions read text instead of the input file. memoized results from the last
+    # input are no use for this one, and a long running worker would keep them all
+    aoc.utils.cache.clear()
+    _texts[day] = TextInput(day, text)
+    try:
+        yield
+    finally:
+        del _texts[day]
+
+
+def input_source(day: int) -> pathlib.Path | TextInput:
+    return _texts.get(day) or aoc.utils.paths.day_input_path(day)
+
+
+def iter_lines(path: pathlib.Path) -> Iterator[str]:
+    # one line at a time, for solvers that only need a single pass over a big input
+    with path.open() as fp:
+        for line in fp:
+            yield line.strip()
+
+
+def iter_ints(path: pathlib.Path) -> Iterator[list[int]]:
+    for line in iter_lines(path):
+        ints = [int(p) for p in line.split()]
+        if ints:
+            yield ints
+
 
 def readlines(path: pathlib.Path) -> list[str]:
+    return list(iter_lines(path))
+
+
+def readlines_ints(path: pathlib.Path) -> list[list[int]]:
+    # the whole file at once, int() takes the bytes as they are so no line is decoded or stripped
+    rows = []
+    for line in path.read_bytes().splitlines():
+        ints = list(map(int, line.split()))
+        if ints:
+            rows.append(ints)
+    return rows
+
+
+def read_all_ints(path: pathlib.Path) -> list[int]:
+    # one regex pass over the file, line breaks and any other separators are ignored
+    return list(map(int, int_pattern.findall(path.read_bytes())))
+
+
+def read_int_rows(path: pathlib.Path) -> list[list[int]]:
+    # every integer on each line, for lines like 'p=0,4 v=3,-3' that split() can't handle
+    rows = []
+    for line in path.read_bytes().splitlines():
+        ints = list(map(int, int_pattern.findall(line)))
+        if ints:
+            rows.append(ints)
+    return rows
+
+
+def read_int_array(path: pathlib.Path) -> numpy.ndarray:
+    # rectangular inputs as a 2-D int64 array, for solving with numpy where it's installed. no day needs it
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('reading an input as an array needs numpy') from e
+    rows = read_int_rows(path)
+    if len({len(row) for row in rows}) > 1:
+        raise ValueError(f'{path.name}: rows have different numbers of integers')
+    return numpy.array(rows, dtype=numpy.int64)
+
+
+def map_bytes(path: pathlib.Path) -> memoryview:
+    # the whole file without reading it, pages are loaded by the OS as they're touched.
+    # the mapping outlives the file being closed and stays open while the view is referenced
+    if isinstance(path, TextInput):
+        return memoryview(path.read_bytes())
+    with path.open('rb') as fp:
+        if not path.stat().st_size:
+            # can't map an empty file
+            return memoryview(b'')
+        return memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def readgrid(path: pathlib.Path) -> list[list[str]]:
     lines = []
-    with path.open() as fp:
-        for line in fp.readlines():
-            lines.append(line.strip())
+    for line in readlines(path):
+        lines.append(list(line))
     return lines
 
 
-def readlines_ints(path: pathlib.Path) -> list[list[int]]:
+def readgrid_ints(path: pathlib.Path) -> list[list[int]]:
     lines = []
     for line in readlines(path):
-        ints = []
-        for p in line.split():
-            ip = p.strip()
-            if ip:
-                ints.append(int(ip))
-        if ints:
-            lines.append(ints)
+        il = []
+        for c in list(line):
+            il.append(int(c))
+        lines.append(il)
     return lines
 
 
+def readflatgrid(path: pathlib.Path) -> aoc.utils.grid.FlatGrid:
+    return aoc.utils.grid.FlatGrid.from_bytes(path.read_bytes())
+
+
+def readsections(path: pathlib.Path) -> list[list[str]]:
+    # blocks of lines separated by blank lines
+    sections = [[]]
+    for line in readlines(path):
+        if line:
+            sections[-1].append(line)
+        elif sections[-1]:
+            sections.append([])
+    if not sections[-1]:
+        sections.pop()
+    return sections
+
+
+def copy_parsed(parsed: list | aoc.utils.grid.FlatGrid | numpy.ndarray) -> list | aoc.utils.grid.FlatGrid | numpy.ndarray:
+    # for a solver that changes its input, like day06 putting obstructions in its grid. the cache hands
+    # every caller the same object, changing that would change what the other part and later runs get
+    if not isinstance(parsed, list):
+        # FlatGrid or an array
+        return parsed.copy()
+    if parsed and isinstance(parsed[0], list):
+        return [row[:] for row in parsed]
+    return parsed[:]
+
+
+def cached(day: int, loader: Callable[[pathlib.Path], T], path: pathlib.Path | TextInput) -> T:
+    # text inputs are solved once each, caching them would only fill the cache. the parsed input is
+    # shared, not copied, copying a big grid costs about as much as parsing it. treat it as read only
+    # and use copy_parsed() to get one to change
+    if isinstance(path, TextInput):
+        return loader(path)
+    stat = path.stat()
+    key = (day, loader.__name__, path, stat.st_mtime_ns, stat.st_size)
+    if key not in _parsed:
+        _parsed[key] = loader(path)
+    return _parsed[key]
+
+
+def clear_cache() -> None:
+    _parsed.clear()
+
+
+# set to skip the parsed cache on disk, in the environment so worker processes see it too
+no_persist_var = 'AOC_NO_PARSED_CACHE'
+
+
+def disable_persist() -> None:
+    os.environ[no_persist_var] = '1'
+
+
+def persist_path(day: int, name: str, version: int, digest: str, suffix: str) -> pathlib.Path:
+    return aoc.utils.paths.cache_dir() / 'parsed' / ('day%02d-%s-v%d-%s%s' % (day, name, version, digest[:16], suffix))
+
+
+def dump_parsed(parsed: object) -> tuple[bytes, str]:
+    # marshal is quickest to load but only takes builtin types, anything else is pickled
+    try:
+        return marshal.dumps(parsed), '.marshal'
+    except ValueError:
+        return pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL), '.pickle'
+
+
+def persisted(day: int, loader: Callable[[pathlib.Path], T], version: int, path: pathlib.Path | TextInput) -> T:
+    # the parsed input saved to data/.cache/parsed, keyed by the input's hash and the loader's version,
+    # so later processes load it rather than parsing the text again. bump the version when the loader
+    # changes what it returns. every call loads a fresh copy, so callers can mutate what they get
+    if isinstance(path, TextInput) or os.environ.get(no_persist_var):
+        return loader(path)
+    digest = aoc.utils.answers.file_digest(path)
+    for suffix, load in (('.marshal', marshal.loads), ('.pickle', pickle.loads)):
+        try:
+            return load(persist_path(day, loader.__name__, version, digest, suffix).read_bytes())
+        except FileNotFoundError:
+            continue
+        except Exception:
+            # unreadable, e.g. written by another Python version, parse it again below
+            break
+
+    parsed = loader(path)
+    data, suffix = dump_parsed(parsed)
+    target = persist_path(day, loader.__name__, version, digest, suffix)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # only older versions of this input's snapshot are replaced. other inputs keep theirs, and the
+    # .tmp files other processes are still writing end in the pid, so they never match
+    for stale in target.parent.glob('day%02d-%s-v*-%s.*' % (day, loader.__name__, digest[:16])):
+        if stale.suffix in ('.marshal', '.pickle') and stale != target:
+            stale.unlink(missing_ok=True)
+    tmp = target.with_name(target.name + '.%d.tmp' % os.getpid())
+    tmp.write_bytes(data)
+    tmp.replace(target)
+    return parsed
+
+
+def day_input_persisted(day: int, loader: Callable[[pathlib.Path], T], version: int) -> T:
+    return persisted(day, loader, version, input_source(day))
+
+
 def day_input_lines(day: int) -> list[str]:
-    return readlines(aoc.utils.paths.day_input_path(day))
+    return cached(day, readlines, input_source(day))
 
 
 def day_test_lines(day: int, which: int = 0) -> list[str]:
-    return readlines(aoc.utils.paths.day_test_path(day, which=which))
+    return cached(day, readlines, aoc.utils.paths.day_test_path(day, which=which))
 
 
 def day_file_lines(day: int, filename: str) -> list[str]:
-    return readlines(aoc.utils.paths.day_data_path(day, filename))
+    return cached(day, readlines, aoc.utils.paths.day_data_path(day, filename))
+
+
+def day_input_iter_lines(day: int) -> Iterator[str]:
+    return iter_lines(input_source(day))
+
+
+def day_input_iter_ints(day: int) -> Iterator[list[int]]:
+    return iter_ints(input_source(day))
+
+
+def day_input_bytes(day: int) -> memoryview:
+    return map_bytes(input_source(day))
+
+
+def day_input_sections(day: int) -> list[list[str]]:
+    return cached(day, readsections, input_source(day))
+
+
+def day_test_sections(day: int, which: int = 0) -> list[list[str]]:
+    return cached(day, readsections, aoc.utils.paths.day_test_path(day, which=which))
 
 
 def day_input_grid(day: int) -> list[list[str]]:
-    lines = []
-    for line in readlines(aoc.utils.paths.day_input_path(day)):
-        lines.append(list(line))
-    return lines
+    return cached(day, readgrid, input_source(day))
 
 
 def day_test_grid(day: int, which: int = 0) -> list[list[str]]:
-    lines = []
-    for line in readlines(aoc.utils.paths.day_test_path(day, which=which)):
-        lines.append(list(line))
-    return lines
+    return cached(day, readgrid, aoc.utils.paths.day_test_path(day, which=which))
 
 
 def day_input_ints(day: int) -> list[list[int]]:
-    return readlines_ints(aoc.utils.paths.day_input_path(day))
+    return cached(day, readlines_ints, input_source(day))
 
 
 def day_test_ints(day: int) -> list[list[int]]:
-    return readlines_ints(aoc.utils.paths.day_test_path(day))
+    return cached(day, readlines_ints, aoc.utils.paths.day_test_path(day))
+
+
+def day_input_all_ints(day: int) -> list[int]:
+    return cached(day, read_all_ints, input_source(day))
+
+
+def day_input_int_rows(day: int) -> list[list[int]]:
+    return cached(day, read_int_rows, input_source(day))
+
+
+def day_input_int_array(day: int) -> numpy.ndarray:
+    return cached(day, read_int_array, input_source(day))
+
+
+def day_test_int_array(day: int, which: int = 0) -> numpy.ndarray:
+    return cached(day, read_int_array, aoc.utils.paths.day_test_path(day, which=which))
 
 
 def day_input_grid_ints(day: int) -> list[list[int]]:
-    lines = []
-    for line in readlines(aoc.utils.paths.day_input_path(day)):
-        il = []
-        for c in list(line):
-            il.append(int(c))
-        lines.append(il)
-    return lines
+    return cached(day, readgrid_ints, input_source(day))
 
 
 def day_test_grid_ints(day: int, which: int = 0) -> list[list[int]]:
-    lines = []
-    for line in readlines(aoc.utils.paths.day_test_path(day, which=which)):
-        il = []
-        for c in list(line):
-            il.append(int(c))
-        lines.append(il)
-    return lines
+    return cached(day, readgrid_ints, aoc.utils.paths.day_test_path(day, which=which))
+
+
+def day_input_flatgrid(day: int) -> aoc.utils.grid.FlatGrid:
+    return cached(day, readflatgrid, input_source(day))
+
+
+def day_test_flatgrid(day: int, which: int = 0) -> aoc.utils.grid.FlatGrid:
+    return cached(day, readflatgrid, aoc.utils.paths.day_test_path(day, which=which))
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import datetime
+import importlib
+import time
+import types
+from typing import Callable
+
+import aoc.utils.cache
+import aoc.utils.instrument
+import aoc.utils.memory
+
+parts = (1, 2)
+
+
+class PartResult:
+    def __init__(
+        self,
+        day: int,
+        part: int,
+        answer: int | str | None = None,
+        elapsed: float = 0.0,
+        error: str | None = None,
+        cached: bool = False,
+        timed_out: bool = False,
+    ) -> None:
+        self.day = day
+        self.part = part
+        self.answer = answer
+        self.elapsed = elapsed
+        self.error = error
+        self.cached = cached
+        self.timed_out = timed_out
+        self.memory = None
+        self.cache_stats = None
+        self.regions = None
+
+    def __str__(self) -> str:
+        if self.timed_out:
+            return f'part {self.part}: TIMEOUT (after {self.elapsed:.1f}s)'
+        if self.error:
+            return f'part {self.part}: failed ({self.error})'
+        return f'part {self.part}: {self.answer}'
+
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+def describe_error(error: BaseException) -> str:
+    return f'{type(error).__name__}: {error}'
+
+
+def available_days() -> list[int]:
+    today = datetime.date.today()
+    xmas = datetime.date(2024, 12, 25)
+    end = 25
+    if today < xmas:
+        end = today.day
+    return list(range(1, end + 1))
+
+
+def day_module_name(day: int) -> str:
+    return 'aoc.days.day%02d.run' % day
+
+
+def day_module(day: int) -> types.ModuleType:
+    return importlib.import_module(day_module_name(day))
+
+
+def setup_day(mod: types.ModuleType) -> None:
+    # some days need global state (recursion limit, lookup tables) before their parts run
+    setup = getattr(mod, 'setup', None)
+    if setup:
+        setup()
+
+
+def part_function(day: int, part: int) -> Callable[[], int | str]:
+    mod = day_module(day)
+    setup_day(mod)
+    return getattr(mod, f'part{part}')
+
+
+def run_part(day: int, part: int) -> int | str:
+    return part_function(day, part)()
+
+
+def solve_part(day: int, part: int, memory: bool = False) -> PartResult:
+    # import and setup first so they aren't counted against the part
+    try:
+        func = part_function(day, part)
+    except Exception as e:
+        return PartResult(day, part, error=describe_error(e))
+
+    answer = error = None
+    # caches keep their entries between parts, only the counters start again
+    aoc.utils.cache.reset_stats()
+    aoc.utils.instrument.reset()
+    tracker = aoc.utils.memory.start() if memory else None
+    start = time.perf_counter()
+    try:
+        answer = func()
+    except Exception as e:
+        error = describe_error(e)
+    elapsed = time.perf_counter() - start
+    memory_report = aoc.utils.memory.stop(tracker) if tracker else None
+    result = PartResult(day, part, answer=answer, elapsed=elapsed, error=error)
+    result.memory = memory_report
+    result.cache_stats = aoc.utils.cache.stats()
+    if aoc.utils.instrument.enabled:
+        result.regions = aoc.utils.instrument.summary()
+    return result
+
+
+def solve_day(day: int, memory: bool = False) -> list[PartResult]:
+    return [solve_part(day, part, memory=memory) for part in parts]
+
+
+def parse_day_part(spec: str) -> tuple[int, int | None]:
+    # day[:part], e.g. 6 or 6:2
+    day, _, part = spec.partition(':')
+    if not part:
+        return int(day), None
+    if int(part) not in parts:
+        raise ValueError(f'unknown part: {part}')
+    return int(day), int(part)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import collections
+import os
+import pickle
+import selectors
+import signal
+import sys
+import time
+from typing import Iterator
+
+import aoc.utils.data
+import aoc.utils.days
+import aoc.utils.scheduler
+
+
+def preload(days: list[int]) -> dict[int, Exception]:
+    # import, set up and parse every day's input once in this process, so each forked child starts
+    # with them already in its copy-on-write memory. a day that doesn't read its input as lines has
+    # a load() its parts parse it with. days 02 and 03 stream their input, they only find it in the
+    # page cache, and days 05 and 23 find their parsed snapshot already written
+    failed = {}
+    for day in days:
+        try:
+            mod = aoc.utils.days.day_module(day)
+            aoc.utils.days.setup_day(mod)
+            load = getattr(mod, 'load', None)
+            if load:
+                load()
+            else:
+                aoc.utils.data.day_input_lines(day)
+        except Exception as e:
+            failed[day] = e
+    return failed
+
+
+def child(write_fd: int, day: int, parts: list[int], memory: bool) -> None:
+    # never returns, whatever happens the child must not carry on into the parent's code
+    status = 1
+    try:
+        results = [aoc.utils.days.solve_part(day, part, memory=memory) for part in parts]
+        data = pickle.dumps(results)
+        with os.fdopen(write_fd, 'wb') as fp:
+            fp.write(data)
+        status = 0
+    finally:
+        os._exit(status)
+
+
+class Fork:
+    def __init__(self, day: int, parts: list[int], budget: float | None, memory: bool) -> None:
+        self.day = day
+        self.parts = parts
+        read_fd, write_fd = os.pipe()
+        # anything still buffered would be written again by the child
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self.pid = os.fork()
+        if not self.pid:
+            os.close(read_fd)
+            child(write_fd, day, parts, memory)
+        os.close(write_fd)
+        self.fd = read_fd
+        self.chunks = []
+        self.start = time.monotonic()
+        self.deadline = self.start + budget if budget else None
+
+    def read(self) -> bool:
+        # False once the child has closed its end
+        chunk = os.read(self.fd, 1 << 16)
+        if chunk:
+            self.chunks.append(chunk)
+        return bool(chunk)
+
+    def wait(self) -> int:
+        _, status = os.waitpid(self.pid, 0)
+        os.close(self.fd)
+        return os.waitstatus_to_exitcode(status)
+
+    def results(self) -> list[aoc.utils.days.PartResult]:
+        exit_code = self.wait()
+        if exit_code == 0:
+            return pickle.loads(b''.join(self.chunks))
+        elapsed = time.monotonic() - self.start
+        return [aoc.utils.days.PartResult(self.day, part, elapsed=elapsed, error=f'worker died (exit code {exit_code})') for part in self.parts]
+
+    def kill(self) -> list[aoc.utils.days.PartResult]:
+        os.kill(self.pid, signal.SIGKILL)
+        self.wait()
+        elapsed = time.monotonic() - self.start
+        return [aoc.utils.days.PartResult(self.day, part, elapsed=elapsed, timed_out=True) for part in self.parts]
+
+
+def run(
+    tasks: list[tuple[int, list[int]]],
+    jobs: int,
+    budget: aoc.utils.scheduler.Budget | None = None,
+    memory: bool = False,
+) -> Iterator[aoc.utils.days.PartResult]:
+    # one forked child per (day, parts) task, up to jobs at once, results are yielded as they finish.
+    # with a budget, a task's parts share the sum of their budgets
+    if not hasattr(os, 'fork'):
+        raise RuntimeError('the fork server needs os.fork')
+    pending = collections.deque(tasks)
+    active = {}
+    with selectors.DefaultSelector() as selector:
+        while pending or active:
+            while pending and len(active) < jobs:
+                day, parts = pending.popleft()
+                budgets = [budget(day, part) for part in parts] if budget else [None]
+                limit = sum(budgets) if all(budgets) else None
+                fork = Fork(day, parts, limit, memory)
+                active[fork.fd] = fork
+                selector.register(fork.fd, selectors.EVENT_READ, fork)
+
+            deadlines = [f.deadline for f in active.values() if f.deadline]
+            timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+            for key, _ in selector.select(timeout):
+                fork = key.data
+                if not fork.read():
+                    selector.unregister(fork.fd)
+                    del active[fork.fd]
+                    yield from fork.results()
+
+            now = time.monotonic()
+            for fd, fork in list(active.items()):
+                if fork.deadline and fork.deadline <= now:
+                    selector.unregister(fd)
+                    del active[fd]
+                    yield from fork.kill()
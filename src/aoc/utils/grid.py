@@ -1,105 +1,96 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 import aoc.utils.types
 
+# compass directions and their offsets, in the order all_neighbours() and compass_neighbours() list them
+compass = (
+    ('W', -1, 0),
+    ('NW', -1, -1),
+    ('SW', -1, 1),
+    ('E', 1, 0),
+    ('NE', 1, -1),
+    ('SE', 1, 1),
+    ('N', 0, -1),
+    ('S', 0, 1),
+)
+# bits of the same label masks for the four directions neighbours() covers
+four_compass_mask = 0b11001001
+
+
+def mask_to_directions(mask: int) -> tuple[str, ...]:
+    return tuple(d for bit, (d, _, _) in enumerate(compass) if mask & (1 << bit))
+
+
+# every 8-bit same label mask to its directions
+mask_directions = tuple(mask_to_directions(mask) for mask in range(256))
+
+
+class GridTopology:
+    # neighbour tables for one grid shape, worked out once and shared by every grid of that shape.
+    # tables are flat, indexed by y * width + x, and hold the same Point objects each time
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.neighbours = []
+        self.all_neighbours = []
+        # (bit, point) for each on grid compass neighbour
+        self.compass = []
+        self.edge_count = []
+        points = [aoc.utils.types.Point(x, y) for y in range(height) for x in range(width)]
+        for y in range(height):
+            for x in range(width):
+                on_grid = []
+                for bit, (d, dx, dy) in enumerate(compass):
+                    nx = x + dx
+                    ny = y + dy
+                    if 0 <= nx < width and 0 <= ny < height:
+                        on_grid.append((bit, d, points[ny * width + nx]))
+                self.all_neighbours.append(tuple(p for _, _, p in on_grid))
+                self.neighbours.append(tuple(p for bit, _, p in on_grid if (1 << bit) & four_compass_mask))
+                self.compass.append(tuple((1 << bit, p) for bit, _, p in on_grid))
+                self.edge_count.append((x == 0) + (y == 0) + (x == width - 1) + (y == height - 1))
+
+    def index(self, point: aoc.utils.types.Point) -> int:
+        return point.y * self.width + point.x
+
+    def label_mask(self, grid: list[list[str]], point: aoc.utils.types.Point) -> int:
+        # a bit set for each compass neighbour with the same label as the point
+        target = grid[point.y][point.x]
+        mask = 0
+        for bit, n in self.compass[point.y * self.width + point.x]:
+            if grid[n.y][n.x] == target:
+                mask |= bit
+        return mask
+
+
+_topologies = {}
+
+
+def topology(grid: list[list[str]]) -> GridTopology:
+    shape = (len(grid[0]), len(grid))
+    if shape not in _topologies:
+        _topologies[shape] = GridTopology(*shape)
+    return _topologies[shape]
+
+
+def neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> tuple[aoc.utils.types.Point, ...]:
+    t = topology(grid)
+    return t.neighbours[point.y * t.width + point.x]
+
+
+def all_neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> tuple[aoc.utils.types.Point, ...]:
+    t = topology(grid)
+    return t.all_neighbours[point.y * t.width + point.x]
+
+
+def compass_neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> tuple[str, ...]:
+    return mask_directions[topology(grid).label_mask(grid, point)]
+
 
-def neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> list[aoc.utils.types.Point]:
-    ns = []
-    grid_width = len(grid[0])
-    grid_height = len(grid)
-    if point.x > 0:
-        ns.append(aoc.utils.types.Point(point.x - 1, point.y))
-    if point.x < grid_width - 1:
-        ns.append(aoc.utils.types.Point(point.x + 1, point.y))
-    if point.y > 0:
-        ns.append(aoc.utils.types.Point(point.x, point.y - 1))
-    if point.y < grid_height - 1:
-        ns.append(aoc.utils.types.Point(point.x, point.y + 1))
-    return ns
-
-
-def all_neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> list[aoc.utils.types.Point]:
-    ns = []
-    grid_width = len(grid[0])
-    grid_height = len(grid)
-    if point.x > 0:
-        ns.append(aoc.utils.types.Point(point.x - 1, point.y))
-        if point.y > 0:
-            ns.append(aoc.utils.types.Point(point.x - 1, point.y - 1))
-        if point.y < grid_height - 1:
-            ns.append(aoc.utils.types.Point(point.x - 1, point.y + 1))
-
-    if point.x < grid_width - 1:
-        ns.append(aoc.utils.types.Point(point.x + 1, point.y))
-        if point.y > 0:
-            ns.append(aoc.utils.types.Point(point.x + 1, point.y - 1))
-        if point.y < grid_height - 1:
-            ns.append(aoc.utils.types.Point(point.x + 1, point.y + 1))
-
-    if point.y > 0:
-        ns.append(aoc.utils.types.Point(point.x, point.y - 1))
-
-    if point.y < grid_height - 1:
-        ns.append(aoc.utils.types.Point(point.x, point.y + 1))
-    return ns
-
-
-def compass_neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> list[str]:
-    ns = []
-    target = grid[point.y][point.x]
-    grid_width = len(grid[0])
-    grid_height = len(grid)
-    if point.x > 0:
-        if char_at_point(grid, aoc.utils.types.Point(point.x - 1, point.y)) == target:
-            ns.append('W')
-        if point.y > 0:  # noqa: SIM102
-            if char_at_point(grid, aoc.utils.types.Point(point.x - 1, point.y - 1)) == target:
-                ns.append('NW')
-        if point.y < grid_height - 1:  # noqa: SIM102
-            if char_at_point(grid, aoc.utils.types.Point(point.x - 1, point.y + 1)) == target:
-                ns.append('SW')
-
-    if point.x < grid_width - 1:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x + 1, point.y)) == target:
-            ns.append('E')
-        if point.y > 0:  # noqa: SIM102
-            if char_at_point(grid, aoc.utils.types.Point(point.x + 1, point.y - 1)) == target:
-                ns.append('NE')
-        if point.y < grid_height - 1:  # noqa: SIM102
-            if char_at_point(grid, aoc.utils.types.Point(point.x + 1, point.y + 1)) == target:
-                ns.append('SE')
-
-    if point.y > 0:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x, point.y - 1)) == target:
-            ns.append('N')
-
-    if point.y < grid_height - 1:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x, point.y + 1)) == target:
-            ns.append('S')
-    return ns
-
-
-def four_compass_neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> list[str]:
-    ns = []
-    target = grid[point.y][point.x]
-    grid_width = len(grid[0])
-    grid_height = len(grid)
-    if point.x > 0:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x - 1, point.y)) == target:
-            ns.append('W')
-
-    if point.x < grid_width - 1:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x + 1, point.y)) == target:
-            ns.append('E')
-
-    if point.y > 0:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x, point.y - 1)) == target:
-            ns.append('N')
-
-    if point.y < grid_height - 1:  # noqa: SIM102
-        if char_at_point(grid, aoc.utils.types.Point(point.x, point.y + 1)) == target:
-            ns.append('S')
-    return ns
+def four_compass_neighbours(grid: list[list[str]], point: aoc.utils.types.Point) -> tuple[str, ...]:
+    return mask_directions[topology(grid).label_mask(grid, point) & four_compass_mask]
 
 
 def char_at_point(grid: list[list[str]], point: aoc.utils.types.Point) -> str:
@@ -114,21 +105,91 @@ def chars_at_points(grid: list[list[str]], points: list[aoc.utils.types.Point])
 
 
 def point_is_on_grid_edge(grid: list[list[str]], point: aoc.utils.types.Point) -> bool:
-    max_x = len(grid[0]) - 1
-    max_y = len(grid) - 1
-    return point.x == 0 or point.y == 0 or point.x == max_x or point.y == max_y
+    return point_grid_edge_count(grid, point) > 0
 
 
 def point_grid_edge_count(grid: list[list[str]], point: aoc.utils.types.Point) -> int:
-    max_x = len(grid[0]) - 1
-    max_y = len(grid) - 1
-    count = 0
-    if point.x == 0:
-        count += 1
-    if point.y == 0:
-        count += 1
-    if point.x == max_x:
-        count += 1
-    if point.y == max_y:
-        count += 1
-    return count
+    t = topology(grid)
+    return t.edge_count[point.y * t.width + point.x]
+
+
+class FlatGrid:
+    # the grid's bytes in one bytearray, row after row, with a border of padding cells all the way
+    # round. cells are plain int indices, a cell's neighbours are always at +-1 and +-stride, and
+    # stepping off the grid lands on the border so neighbour lookups never need a bounds check
+    def __init__(self, rows: list[bytes], padding: int = 0) -> None:
+        self.width = len(rows[0]) if rows else 0
+        self.height = len(rows)
+        self.stride = self.width + 2
+        self.padding = padding
+        pad = bytes([padding])
+        cells = bytearray(pad * self.stride)
+        for row in rows:
+            cells += pad
+            cells += row
+            cells += pad
+        cells += pad * self.stride
+        self.cells = cells
+        # same order as neighbours(), W E N S
+        self.offsets = (-1, 1, -self.stride, self.stride)
+        # same order as all_neighbours(), W NW SW E NE SE N S
+        self.all_offsets = (-1, -1 - self.stride, -1 + self.stride, 1, 1 - self.stride, 1 + self.stride, -self.stride, self.stride)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, padding: int = 0) -> FlatGrid:
+        return cls([line for line in data.splitlines() if line], padding=padding)
+
+    def copy(self) -> FlatGrid:
+        grid = FlatGrid.__new__(FlatGrid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells[:]
+        return grid
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __str__(self) -> str:
+        return '\n'.join(row.decode() for row in self.rows())
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def index_of_point(self, point: aoc.utils.types.Point) -> int:
+        return self.index(point.x, point.y)
+
+    def xy(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def point(self, index: int) -> aoc.utils.types.Point:
+        return aoc.utils.types.Point(*self.xy(index))
+
+    def on_grid(self, index: int) -> bool:
+        x, y = self.xy(index)
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def indices(self) -> Iterator[int]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def rows(self) -> Iterator[bytes]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield bytes(self.cells[start : start + self.width])
+
+    def find(self, value: int) -> list[int]:
+        return [i for i in self.indices() if self.cells[i] == value]
+
+    def neighbours(self, index: int) -> list[int]:
+        # includes border cells, they hold the padding value
+        return [index + o for o in self.offsets]
+
+    def all_neighbours(self, index: int) -> list[int]:
+        return [index + o for o in self.all_offsets]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import datetime
+import pathlib
+import platform
+import sqlite3
+import subprocess
+
+import aoc.utils.paths
+
+schema = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    git_commit TEXT,
+    python TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    repeat INTEGER NOT NULL,
+    min REAL NOT NULL,
+    median REAL NOT NULL,
+    peak INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_part ON results (day, part, input);
+"""
+
+
+def default_path() -> pathlib.Path:
+    return aoc.utils.paths.cache_dir() / 'bench.sqlite'
+
+
+def connect(path: pathlib.Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.executescript(schema)
+    return db
+
+
+def git_commit() -> str | None:
+    # marked -dirty when there are uncommitted changes, those timings aren't for the commit
+    try:
+        out = subprocess.run(
+            ['git', 'describe', '--always', '--dirty'],
+            cwd=pathlib.Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def record(db: sqlite3.Connection, results: list[dict]) -> int:
+    with db:
+        cursor = db.execute(
+            'INSERT INTO runs (created, git_commit, python) VALUES (?, ?, ?)',
+            (datetime.datetime.now().isoformat(timespec='seconds'), git_commit(), platform.python_version()),
+        )
+        run_id = cursor.lastrowid
+        db.executemany(
+            'INSERT INTO results (run_id, day, part, input, input_hash, repeat, min, median, peak) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(run_id, r['day'], r['part'], r['input'], r['input_hash'], r['repeat'], r['min'], r['median'], r.get('peak')) for r in results],
+        )
+    return run_id
+
+
+def parts(db: sqlite3.Connection, days: list[int] | None = None) -> list[tuple[int, int, str]]:
+    rows = db.execute('SELECT DISTINCT day, part, input FROM results ORDER BY day, part, input').fetchall()
+    return [(r['day'], r['part'], r['input']) for r in rows if not days or r['day'] in days]
+
+
+def part_history(db: sqlite3.Connection, day: int, part: int, input: str) -> list[sqlite3.Row]:
+    return db.execute(
+        """
+        SELECT runs.id, runs.created, runs.git_commit, runs.python, results.input_hash, results.min, results.median, results.peak
+        FROM results JOIN runs ON runs.id = results.run_id
+        WHERE results.day = ? AND results.part = ? AND results.input = ?
+        ORDER BY runs.id
+        """,
+        (day, part, input),
+    ).fetchall()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+
+class ImportTime:
+    def __init__(self, name: str, own: int, cumulative: int, depth: int) -> None:
+        # times in microseconds, as -X importtime reports them
+        self.name = name
+        self.own = own
+        self.cumulative = cumulative
+        # 0 for a module imported directly, more for those it imported in turn
+        self.depth = depth
+
+
+def parse(report: str) -> list[ImportTime]:
+    # lines like 'import time:       228 |      14222 |   concurrent.futures'
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        own, cumulative, name = line[len('import time:') :].split('|')
+        if not own.strip().isdigit():
+            # the header
+            continue
+        stripped = name.lstrip(' ')
+        rows.append(ImportTime(stripped.strip(), int(own), int(cumulative), (len(name) - len(stripped) - 1) // 2))
+    return rows
+
+
+def run_python(code: str, importtime: bool = False) -> tuple[float, str]:
+    # a fresh interpreter, so nothing is already imported. returns the wall time and stderr
+    args = [sys.executable]
+    if importtime:
+        args += ['-X', 'importtime']
+    start = time.perf_counter()
+    out = subprocess.run([*args, '-c', code], capture_output=True, text=True, env=os.environ.copy(), check=True)
+    return time.perf_counter() - start, out.stderr
+
+
+def measure(modules: list[str]) -> list[ImportTime]:
+    _, report = run_python(''.join(f'import {m}\n' for m in modules), importtime=True)
+    return parse(report)
+
+
+def startup(modules: list[str], repeat: int = 5) -> tuple[float, float]:
+    # best of repeat, for a bare interpreter and for one that imports the modules
+    bare = min(run_python('pass')[0] for _ in range(repeat))
+    code = ''.join(f'import {m}\n' for m in modules)
+    loaded = min(run_python(code)[0] for _ in range(repeat))
+    return bare, loaded
+
+
+def print_report(rows: list[ImportTime], top: int = 25) -> None:
+    # slowest first by cumulative time, the tree of who imported what is in the indentation of -X importtime
+    rows = sorted(rows, key=lambda r: r.cumulative, reverse=True)[:top]
+    width = max((len(r.name) + 2 * r.depth for r in rows), default=0)
+    print(f'{"module":<{width}}  {"own ms":>8}  {"total ms":>8}')
+    for r in rows:
+        name = '  ' * r.depth + r.name
+        print(f'{name:<{width}}  {r.own / 1000:>8.2f}  {r.cumulative / 1000:>8.2f}')
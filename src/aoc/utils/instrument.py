@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import time
+from typing import Callable, Iterator, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+# read once, when this module is imported: switched off, region() hands back the function unchanged
+# so the hot paths cost nothing. setting the variable after that has no effect, call enable() instead.
+# enable() sets it in the environment too so worker processes pick it up
+enabled_var = 'AOC_INSTRUMENT'
+enabled = bool(os.environ.get(enabled_var))
+
+
+class Region:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        # recursive calls are counted but only the outermost is timed
+        self.depth = 0
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+
+
+regions = {}
+
+
+def enable() -> None:
+    # must be called before the days are imported, their regions are wrapped (or not) at import
+    global enabled
+    enabled = True
+    os.environ[enabled_var] = '1'
+
+
+def get_region(name: str) -> Region:
+    if name not in regions:
+        regions[name] = Region(name)
+    return regions[name]
+
+
+def region(func: F) -> F:
+    if not enabled:
+        return func
+
+    r = get_region(func.__qualname__)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        r.calls += 1
+        if r.depth:
+            return func(*args, **kwargs)
+        r.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            r.seconds += time.perf_counter() - start
+            r.depth -= 1
+
+    return wrapper  # type: ignore
+
+
+@contextlib.contextmanager
+def timed(name: str) -> Iterator[None]:
+    # a block rather than a function, e.g. one phase of a part
+    if not enabled:
+        yield
+        return
+    r = get_region(name)
+    r.calls += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        r.seconds += time.perf_counter() - start
+
+
+def summary() -> list[dict]:
+    # the regions hit since the last reset, slowest first
+    used = [r for r in regions.values() if r.calls]
+    used.sort(key=lambda r: r.seconds, reverse=True)
+    return [{'name': r.name, 'calls': r.calls, 'seconds': r.seconds} for r in used]
+
+
+def reset() -> None:
+    for r in regions.values():
+        r.reset()
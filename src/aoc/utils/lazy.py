@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    # the module is found now but only executed when one of its attributes is first used, for imports
+    # that only some code paths need. a submodule is also set on its package, so aoc.bench.x works
+    # after lazy_import('aoc.bench') just as after import aoc.bench
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f'no module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    package, _, child = name.rpartition('.')
+    if package:
+        setattr(sys.modules[package], child, module)
+    return module
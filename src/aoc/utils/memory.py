@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import linecache
+import resource
+import sys
+import threading
+import tracemalloc
+
+
+def format_bytes(size: float) -> str:
+    for unit in ['B', 'KiB', 'MiB']:
+        if abs(size) < 1024:
+            return f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GiB'
+
+
+def process_peak_rss() -> int:
+    # the high-water mark for the whole process so far, it never goes down, so in a process that
+    # has already run other parts it may be theirs rather than the current part's
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    if sys.platform == 'darwin':
+        return rss
+    return rss * 1024
+
+
+class PeakTracker(threading.Thread):
+    # tracemalloc only reports the peak size, not where it was allocated, and by the
+    # time the part returns its big structures are gone, so poll and keep a snapshot
+    # from as close to the peak as we can get
+    def __init__(self, interval: float = 0.01, growth: float = 1.1) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.stopping = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopping.wait(self.interval):
+            self.check()
+
+    def check(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self) -> None:
+        self.stopping.set()
+        self.join()
+        self.check()
+
+
+def start() -> PeakTracker:
+    tracker = PeakTracker()
+    tracemalloc.start()
+    tracker.start()
+    return tracker
+
+
+def stop(tracker: PeakTracker, top: int = 5) -> dict:
+    tracker.stop()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'peak': peak,
+        'process_rss': process_peak_rss(),
+        'sites': top_sites(tracker.snapshot, top) if tracker.snapshot else [],
+    }
+
+
+def short_filename(filename: str) -> str:
+    _, sep, tail = filename.rpartition('/aoc/')
+    if sep:
+        return 'aoc/' + tail
+    return filename
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[str]:
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, '*/_weakrefset.py'),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    sites = []
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        line = linecache.getline(frame.filename, frame.lineno).strip()
+        sites.append(f'{format_bytes(stat.size)} in {stat.count} blocks: {short_filename(frame.filename)}:{frame.lineno}: {line}')
+    return sites
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import os
 import pathlib
 
+# the file day_input_path() points at, switched to run the days on other inputs such as the
+# generated scaleK.txt files, kept in the environment so worker processes see it too
+input_filename_var = 'AOC_INPUT'
+
 
 def data_dir() -> pathlib.Path:
     root_dir = pathlib.Path(__file__).absolute().parent.parent.parent.parent
@@ -17,11 +22,41 @@ def day_data_path(day: int, filename: str) -> pathlib.Path:
     return day_data_dir(day) / filename
 
 
+def input_filename() -> str:
+    return os.environ.get(input_filename_var, 'input.txt')
+
+
+def set_input_filename(filename: str) -> None:
+    os.environ[input_filename_var] = filename
+
+
 def day_input_path(day: int) -> pathlib.Path:
-    return day_data_path(day, 'input.txt')
+    return day_data_path(day, input_filename())
+
+
+def scale_filename(scale: int) -> str:
+    return f'scale{scale}.txt'
+
+
+def day_scale_path(day: int, scale: int) -> pathlib.Path:
+    return day_data_path(day, scale_filename(scale))
 
 
 def day_test_path(day: int, which: int = 0) -> pathlib.Path:
     if which == 0:
         return day_data_path(day, 'test.txt')
     return day_data_path(day, f'test{which}.txt')
+
+
+def day_answers_path(day: int) -> pathlib.Path:
+    # known answers for each of the day's inputs, see aoc/verify.py
+    return day_data_path(day, 'answers.json')
+
+
+def cache_dir() -> pathlib.Path:
+    return data_dir() / '.cache'
+
+
+def day_source_dir(day: int) -> pathlib.Path:
+    days_dir = pathlib.Path(__file__).absolute().parent.parent / 'days'
+    return days_dir / ('day%02d' % day)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import collections
+import cProfile
+import pathlib
+import pstats
+import signal
+import sys
+import time
+import types
+from typing import Callable, TypeVar
+
+import aoc.utils.days
+import aoc.utils.memory
+
+T = TypeVar('T')
+
+
+def profile_path(output_dir: pathlib.Path, day: int, part: int) -> pathlib.Path:
+    return output_dir / ('day%02d-part%d.prof' % (day, part))
+
+
+def profile_part(day: int, part: int, output_dir: pathlib.Path, top: int = 25) -> aoc.utils.days.PartResult:
+    # import and setup outside the profile so only the part itself is measured
+    func = aoc.utils.days.part_function(day, part)
+
+    profiler = cProfile.Profile()
+    try:
+        answer = profiler.runcall(func)
+    except Exception as e:
+        result = aoc.utils.days.PartResult(day, part, error=aoc.utils.days.describe_error(e))
+    else:
+        result = aoc.utils.days.PartResult(day, part, answer=answer)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = profile_path(output_dir, day, part)
+    profiler.dump_stats(path)
+
+    stats = pstats.Stats(profiler)
+    result.elapsed = stats.total_tt
+    stats.strip_dirs()
+    print('day%02d/part%d: profile written to %s' % (day, part, path))
+    print('-- flat (tottime) --')
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    print('-- cumulative --')
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result
+
+
+class Sampler:
+    # a statistical profiler: a CPU time interval timer interrupts the process and the handler records
+    # the interrupted stack. the code runs at full speed between samples, unlike under cProfile where
+    # every call pays, so deep recursion isn't distorted. main thread only, and not on Windows
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        # stacks as tuples of code objects, outermost first, formatted when written out
+        self.stacks = collections.Counter()
+        self.samples = 0
+        # frames from here outwards are the runner's, not the part's
+        self.root = None
+
+    def handle(self, signum: int, frame: types.FrameType | None) -> None:
+        codes = []
+        while frame is not None and frame.f_code is not self.root:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        self.stacks[tuple(codes)] += 1
+        self.samples += 1
+
+    def run(self, func: Callable[[], T]) -> T:
+        self.root = sys._getframe().f_code
+        previous = signal.signal(signal.SIGPROF, self.handle)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def collapsed(self) -> list[str]:
+        # one line per distinct stack, 'outer;inner;leaf count', the input flamegraph.pl, speedscope
+        # and inferno all take
+        lines = []
+        for codes, count in self.stacks.most_common():
+            lines.append(';'.join(code_label(code) for code in codes) + f' {count}')
+        return lines
+
+    def top(self, n: int) -> tuple[list[tuple[str, int]], list[tuple[str, int]]]:
+        # samples with each function as the leaf (own time), and anywhere on the stack (cumulative)
+        own = collections.Counter()
+        cumulative = collections.Counter()
+        for codes, count in self.stacks.items():
+            if codes:
+                own[code_label(codes[-1])] += count
+            for label in {code_label(code) for code in codes}:
+                cumulative[label] += count
+        return own.most_common(n), cumulative.most_common(n)
+
+
+def code_label(code: types.CodeType) -> str:
+    # no spaces or semicolons, they separate the frames and the count
+    filename = aoc.utils.memory.short_filename(code.co_filename).replace(' ', '_')
+    return f'{code.co_qualname}({filename}:{code.co_firstlineno})'.replace(';', ',')
+
+
+def samples_path(output_dir: pathlib.Path, day: int, part: int) -> pathlib.Path:
+    return output_dir / ('day%02d-part%d.folded' % (day, part))
+
+
+def print_top(title: str, rows: list[tuple[str, int]], samples: int) -> None:
+    print(f'-- {title} --')
+    for label, count in rows:
+        print(f'{count:>8} {count / samples * 100:6.1f}%  {label}')
+
+
+def sample_part(day: int, part: int, output_dir: pathlib.Path, interval: float = 0.001, top: int = 25) -> aoc.utils.days.PartResult:
+    func = aoc.utils.days.part_function(day, part)
+
+    sampler = Sampler(interval)
+    start = time.perf_counter()
+    try:
+        answer = sampler.run(func)
+    except Exception as e:
+        result = aoc.utils.days.PartResult(day, part, error=aoc.utils.days.describe_error(e))
+    else:
+        result = aoc.utils.days.PartResult(day, part, answer=answer)
+    result.elapsed = time.perf_counter() - start
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = samples_path(output_dir, day, part)
+    path.write_text(''.join(line + '\n' for line in sampler.collapsed()))
+
+    print('day%02d/part%d: %d samples written to %s' % (day, part, sampler.samples, path))
+    if sampler.samples:
+        own, cumulative = sampler.top(top)
+        print_top('own samples', own, sampler.samples)
+        print_top('cumulative samples', cumulative, sampler.samples)
+    return result
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import collections
+import multiprocessing
+import multiprocessing.connection
+import time
+from typing import Callable, Iterator
+
+import aoc.utils.days
+
+Budget = Callable[[int, int], float | None]
+
+
+def worker(conn: multiprocessing.connection.Connection, day: int, part: int, memory: bool) -> None:
+    result = aoc.utils.days.solve_part(day, part, memory=memory)
+    conn.send(result)
+    conn.close()
+
+
+class Job:
+    def __init__(self, day: int, part: int, budget: float | None, memory: bool) -> None:
+        self.day = day
+        self.part = part
+        self.budget = budget
+        recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+        self.conn = recv_conn
+        self.process = multiprocessing.Process(target=worker, args=(send_conn, day, part, memory), daemon=True)
+        self.process.start()
+        # the child has its own copy now
+        send_conn.close()
+        self.start = time.monotonic()
+        self.deadline = self.start + budget if budget else None
+
+    def result(self) -> aoc.utils.days.PartResult:
+        try:
+            result = self.conn.recv()
+        except EOFError:
+            self.process.join()
+            result = aoc.utils.days.PartResult(
+                self.day,
+                self.part,
+                elapsed=time.monotonic() - self.start,
+                error=f'worker died (exit code {self.process.exitcode})',
+            )
+        self.close()
+        return result
+
+    def kill(self) -> aoc.utils.days.PartResult:
+        self.process.kill()
+        self.close()
+        return aoc.utils.days.PartResult(self.day, self.part, elapsed=time.monotonic() - self.start, timed_out=True)
+
+    def close(self) -> None:
+        self.process.join()
+        self.process.close()
+        self.conn.close()
+
+
+def run(tasks: list[tuple[int, int]], jobs: int, budget: Budget, memory: bool = False) -> Iterator[aoc.utils.days.PartResult]:
+    # each part runs in its own process so one that overruns its budget can be killed
+    # without affecting the others, results are yielded as they finish
+    pending = collections.deque(tasks)
+    active = {}
+    while pending or active:
+        while pending and len(active) < jobs:
+            day, part = pending.popleft()
+            job = Job(day, part, budget(day, part), memory)
+            active[job.conn] = job
+
+        deadlines = [j.deadline for j in active.values() if j.deadline]
+        timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+        for conn in multiprocessing.connection.wait(list(active), timeout):
+            yield active.pop(conn).result()
+
+        now = time.monotonic()
+        for conn, job in list(active.items()):
+            if job.deadline and job.deadline <= now:
+                del active[conn]
+                yield job.kill()
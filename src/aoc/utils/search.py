@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import array
+import collections
+import heapq
+from typing import Callable, Collection, Iterable
+
+# states are ints in range(size), a grid cell is usually y * width + x, with a direction
+# or other state folded in as needed. neighbours(state) gives the next states, or
+# (state, cost) pairs for the weighted searches
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+Heuristic = Callable[[int], int]
+
+unreached = -1
+
+
+class SearchResult:
+    def __init__(self, size: int, all_predecessors: bool = False) -> None:
+        self.distance = array.array('q', [unreached]) * size
+        self.previous = array.array('q', [unreached]) * size
+        # every state a state can be reached from at its best distance, only kept when asked for
+        self.predecessors = {} if all_predecessors else None
+        # the target the search stopped at
+        self.target = None
+
+    def reached(self, state: int) -> bool:
+        return self.distance[state] != unreached
+
+    def found(self) -> bool:
+        return self.target is not None
+
+    def start(self, state: int) -> None:
+        self.distance[state] = 0
+        if self.predecessors is not None:
+            self.predecessors[state] = []
+
+    def relax(self, state: int, previous: int, distance: int) -> bool:
+        # True if this is a new best distance to state
+        best = self.distance[state]
+        if best == unreached or distance < best:
+            self.distance[state] = distance
+            self.previous[state] = previous
+            if self.predecessors is not None:
+                self.predecessors[state] = [previous]
+            return True
+        if distance == best and self.predecessors is not None and previous not in self.predecessors[state]:
+            self.predecessors[state].append(previous)
+        return False
+
+    def path(self, target: int | None = None) -> list[int] | None:
+        state = self.target if target is None else target
+        if state is None or not self.reached(state):
+            return None
+        path = [state]
+        while self.previous[state] != unreached:
+            state = self.previous[state]
+            path.append(state)
+        return path[::-1]
+
+    def on_shortest_paths(self, targets: Iterable[int] | None = None) -> set[int]:
+        # every state on any best path to the targets, needs all_predecessors
+        if self.predecessors is None:
+            raise ValueError('search was run without all_predecessors')
+        pending = [t for t in (targets if targets is not None else [self.target]) if t is not None and self.reached(t)]
+        seen = set(pending)
+        while pending:
+            state = pending.pop()
+            for p in self.predecessors[state]:
+                if p not in seen:
+                    seen.add(p)
+                    pending.append(p)
+        return seen
+
+
+def bfs(size: int, starts: Iterable[int], neighbours: Neighbours, targets: Collection[int] = (), all_predecessors: bool = False) -> SearchResult:
+    # every step costs 1
+    result = SearchResult(size, all_predecessors)
+    queue = collections.deque()
+    for s in starts:
+        result.start(s)
+        queue.append(s)
+    distance = result.distance
+    while queue:
+        state = queue.popleft()
+        if state in targets:
+            result.target = state
+            break
+        next_distance = distance[state] + 1
+        for n in neighbours(state):
+            if result.relax(n, state, next_distance):
+                queue.append(n)
+    return result
+
+
+def bfs01(size: int, starts: Iterable[int], neighbours: WeightedNeighbours, targets: Collection[int] = (), all_predecessors: bool = False) -> SearchResult:
+    # steps cost 0 or 1, free steps go to the front of the queue
+    result = SearchResult(size, all_predecessors)
+    settled = bytearray(size)
+    queue = collections.deque()
+    for s in starts:
+        result.start(s)
+        queue.append(s)
+    distance = result.distance
+    while queue:
+        state = queue.popleft()
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if state in targets:
+            result.target = state
+            break
+        current = distance[state]
+        for n, cost in neighbours(state):
+            if result.relax(n, state, current + cost):
+                if cost:
+                    queue.append(n)
+                else:
+                    queue.appendleft(n)
+    return result
+
+
+def dial(
+    size: int,
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    max_cost: int,
+    targets: Collection[int] = (),
+    all_predecessors: bool = False,
+) -> SearchResult:
+    # Dijkstra with a ring of buckets, one per distance, instead of a heap. for small int costs,
+    # no step may cost more than max_cost
+    result = SearchResult(size, all_predecessors)
+    ring = max_cost + 1
+    buckets = [[] for _ in range(ring)]
+    pending = 0
+    for s in starts:
+        result.start(s)
+        buckets[0].append(s)
+        pending += 1
+    distance = result.distance
+    current = 0
+    while pending:
+        bucket = buckets[current % ring]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            # left behind when a better distance was found
+            if distance[state] != current:
+                continue
+            if state in targets:
+                result.target = state
+                return result
+            for n, cost in neighbours(state):
+                if result.relax(n, state, current + cost):
+                    buckets[(current + cost) % ring].append(n)
+                    pending += 1
+        current += 1
+    return result
+
+
+def dijkstra(size: int, starts: Iterable[int], neighbours: WeightedNeighbours, targets: Collection[int] = (), all_predecessors: bool = False) -> SearchResult:
+    return astar(size, starts, neighbours, None, targets=targets, all_predecessors=all_predecessors)
+
+
+def astar(
+    size: int,
+    starts: Iterable[int],
+    neighbours: WeightedNeighbours,
+    heuristic: Heuristic | None,
+    targets: Collection[int] = (),
+    all_predecessors: bool = False,
+) -> SearchResult:
+    # without a heuristic this is Dijkstra. a heuristic must be consistent, h(a) <= cost(a, b) + h(b) for
+    # every step and 0 at the targets. settled states are never reopened, so one that is only admissible
+    # (never overestimates) can settle a state before its best distance is found and return a worse cost
+    result = SearchResult(size, all_predecessors)
+    queue = []
+    for s in starts:
+        result.start(s)
+        queue.append((heuristic(s) if heuristic else 0, s))
+    heapq.heapify(queue)
+    distance = result.distance
+    settled = bytearray(size)
+    while queue:
+        _, state = heapq.heappop(queue)
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if state in targets:
+            result.target = state
+            break
+        current = distance[state]
+        for n, cost in neighbours(state):
+            next_distance = current + cost
+            if result.relax(n, state, next_distance):
+                heapq.heappush(queue, (next_distance + heuristic(n) if heuristic else next_distance, n))
+    return result
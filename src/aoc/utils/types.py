@@ -5,6 +5,9 @@ Point = collections.namedtuple('Point', ['x', 'y'])
 
 
 class Position:
+    # no __dict__, just the two coordinates
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: int, y: int) -> None:
         self.x = x
         self.y = y
@@ -31,7 +34,8 @@ class Position:
         return Position(self.x * value, self.y * value)
 
     def __hash__(self) -> int:
-        return hash((self.x, self.y))
+        # positions can be moved with update() so the hash can't be kept, but it can be worked out without building a tuple
+        return self.x * 1000003 + self.y
 
     def update(self, value: Self) -> Self:
         self.x += value.x
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import fnmatch
+import json
+import os
+import sys
+
+import aoc.bench
+import aoc.utils.days
+import aoc.utils.paths
+
+# data/dayNN/answers.json holds the known answers for each of the day's inputs:
+#   {"input.txt": {"1": 11, "2": 31}, "scale1.txt": {"1": 1114686, "2": 16443518}}
+# --record writes the answers the days give now, after that a run checks they still give them
+
+# inputs --record picks up when none are given, day 21's keypad files aren't inputs
+default_patterns = ['input.txt', 'test*.txt', 'scale*.txt']
+
+
+def load_answers(day: int) -> dict[str, dict[int, int | str]]:
+    path = aoc.utils.paths.day_answers_path(day)
+    try:
+        answers = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    return {filename: {int(part): answer for part, answer in parts.items()} for filename, parts in answers.items()}
+
+
+def store_answers(day: int, answers: dict[str, dict[int, int | str]]) -> None:
+    out = {filename: {str(part): answer for part, answer in sorted(parts.items())} for filename, parts in sorted(answers.items())}
+    aoc.utils.paths.day_answers_path(day).write_text(json.dumps(out, indent=2) + '\n')
+
+
+def day_inputs(day: int, patterns: list[str]) -> list[str]:
+    day_dir = aoc.utils.paths.day_data_dir(day)
+    if not day_dir.is_dir():
+        return []
+    names = sorted(p.name for p in day_dir.iterdir() if p.is_file())
+    return [name for name in names if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+
+
+def check(day: int, part: int, filename: str) -> aoc.utils.days.PartResult:
+    # in a worker, which keeps each day imported between its inputs
+    aoc.utils.paths.set_input_filename(filename)
+    return aoc.utils.days.solve_part(day, part)
+
+
+class Task:
+    def __init__(self, day: int, part: int, filename: str, expected: int | str | None) -> None:
+        self.day = day
+        self.part = part
+        self.filename = filename
+        self.expected = expected
+        self.size = aoc.utils.paths.day_data_path(day, filename).stat().st_size
+
+    def status(self, result: aoc.utils.days.PartResult) -> str:
+        if not result.ok():
+            return 'FAILED'
+        if self.expected is None:
+            return 'new'
+        if result.answer != self.expected:
+            return 'MISMATCH'
+        return 'ok'
+
+    def report(self, result: aoc.utils.days.PartResult, status: str) -> str:
+        line = f'day{self.day:02}/part{self.part} {self.filename}: {status} [{aoc.bench.format_seconds(result.elapsed)}]'
+        if status == 'FAILED':
+            line += f' {result.error}'
+        elif status == 'MISMATCH':
+            line += f' got {result.answer}, expected {self.expected}'
+        elif status == 'new':
+            line += f' {result.answer}'
+        return line
+
+
+def make_tasks(days: list[int], parts: list[int], patterns: list[str] | None, record: bool) -> list[Task]:
+    tasks = []
+    for day in days:
+        answers = load_answers(day)
+        if patterns or record:
+            filenames = day_inputs(day, patterns or default_patterns)
+        else:
+            # only the inputs with known answers
+            filenames = [f for f in sorted(answers) if aoc.utils.paths.day_data_path(day, f).exists()]
+        for filename in filenames:
+            for part in parts:
+                tasks.append(Task(day, part, filename, answers.get(filename, {}).get(part)))
+    # biggest inputs first so a slow one doesn't start last and hold up the end of the run
+    tasks.sort(key=lambda t: t.size, reverse=True)
+    return tasks
+
+
+def verify(tasks: list[Task], jobs: int) -> list[tuple[Task, aoc.utils.days.PartResult, str]]:
+    checked = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(check, t.day, t.part, t.filename): t for t in tasks}
+        for future in concurrent.futures.as_completed(futures):
+            task = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = aoc.utils.days.PartResult(task.day, task.part, error=aoc.utils.days.describe_error(e))
+            status = task.status(result)
+            print(task.report(result, status), flush=True)
+            checked.append((task, result, status))
+    return checked
+
+
+def record(checked: list[tuple[Task, aoc.utils.days.PartResult, str]], overwrite: bool) -> None:
+    # new answers only, a mismatch is kept as it is unless overwrite says the new answer is the right one
+    statuses = ('new', 'MISMATCH') if overwrite else ('new',)
+    by_day = {}
+    for task, result, status in checked:
+        if status in statuses:
+            by_day.setdefault(task.day, []).append((task, result))
+    for day, found in sorted(by_day.items()):
+        answers = load_answers(day)
+        for task, result in found:
+            answers.setdefault(task.filename, {})[task.part] = result.answer
+        store_answers(day, answers)
+        print(f'day{day:02}: {len(found)} answers written to {aoc.utils.paths.day_answers_path(day)}')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Check every day, part and input against the known answers in data/dayNN/answers.json')
+    parser.add_argument('days', nargs='*', type=int, help='days to check (default: all available)')
+    parser.add_argument('-p', '--part', type=int, choices=aoc.utils.days.parts, action='append', help='part to check (default: both)')
+    parser.add_argument(
+        '-i',
+        '--input',
+        metavar='PATTERN',
+        action='append',
+        help='inputs to run, as glob patterns on the filenames in data/dayNN (default: the inputs with known answers)',
+    )
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='number of worker processes (default: one per CPU)')
+    parser.add_argument(
+        '--record',
+        action='store_true',
+        help=f'store the answers for inputs without known ones, for --input or else {", ".join(default_patterns)}',
+    )
+    parser.add_argument('--overwrite', action='store_true', help='with --record, also replace known answers that no longer match')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    days = args.days or aoc.utils.days.available_days()
+    parts = args.part or list(aoc.utils.days.parts)
+    tasks = make_tasks(days, parts, args.input, args.record)
+    if not tasks:
+        print('nothing to check, record some answers with --record', file=sys.stderr)
+        sys.exit(1)
+
+    checked = verify(tasks, args.jobs)
+    counts = {}
+    for _, _, status in checked:
+        counts[status] = counts.get(status, 0) + 1
+    print('\n' + ', '.join(f'{count} {status}' for status, count in sorted(counts.items())))
+    # again in order, they're easy to miss among the others
+    problems = sorted((t.day, t.part, t.filename, t.report(r, s)) for t, r, s in checked if s in ('MISMATCH', 'FAILED'))
+    for *_, line in problems:
+        print(line)
+
+    if args.record:
+        record(checked, args.overwrite)
+    if counts.get('MISMATCH') or counts.get('FAILED'):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()